@@ -4,10 +4,8 @@ from typing import List, Optional, Tuple, Set
 import click
 from rich.console import Console
 
-from .utils import find_device_history, collect_snapshots
+from .utils import find_device_history, collect_snapshots, prune_walk_dirs
 from .debug import get_logger
-from .tui import CommitSelectorApp
-from .repo_browser import RepoBrowserApp
 
 @click.command()
 @click.option(
@@ -92,7 +90,6 @@ def main(repo_paths, repo_labels, device, scroll_to_end, layout, history_dir, de
         scroll_to_end,
     )
     # Helper: resolve device snapshots directory under history (prefer nearest to selected cfg path)
-    history_dir_l = history_dir.lower()
 
     def _resolve_repo_root(path: Optional[str]) -> Optional[str]:
         if not path:
@@ -107,7 +104,7 @@ def main(repo_paths, repo_labels, device, scroll_to_end, layout, history_dir, de
         target = f"{device_name}.cfg"
         for root in repo_roots:
             for walk_root, dirs, files in os.walk(root):
-                dirs[:] = [d for d in dirs if d.lower() != history_dir_l]
+                prune_walk_dirs(dirs, history_dir)
                 if target in files:
                     return os.path.join(walk_root, target), root
         return None, None
@@ -121,10 +118,12 @@ def main(repo_paths, repo_labels, device, scroll_to_end, layout, history_dir, de
     while True:
         # If no device specified or user requested back, launch the browser
         if not device:
-            try:
-                console.clear()
-            except Exception:
-                pass
+            # Deferred: Textual apps are heavy to import and unused for --help/errors
+            from .repo_browser import RepoBrowserApp
+            try:
+                console.clear()
+            except Exception:
+                pass
             browser = RepoBrowserApp(
                 repo_roots,
                 scroll_to_end=scroll_to_end,
@@ -171,8 +170,8 @@ def main(repo_paths, repo_labels, device, scroll_to_end, layout, history_dir, de
             current_config_path = selected_cfg_path
         else:
             for root, dirs, files in os.walk(repo_root_for_device):
-                # prune any history directories from traversal
-                dirs[:] = [d for d in dirs if d.lower() != history_dir_l]
+                # prune history, hidden and tool directories from traversal
+                prune_walk_dirs(dirs, history_dir)
                 if f"{device}.cfg" in files:
                     current_config_path = os.path.join(root, f"{device}.cfg")
                     break
@@ -190,6 +189,7 @@ def main(repo_paths, repo_labels, device, scroll_to_end, layout, history_dir, de
             console.print("[bold yellow]Note:[/bold yellow] Fewer than two items available; select two to see a diff when more are present.")
 
         try:
+            from .tui import CommitSelectorApp
             try:
                 console.clear()
             except Exception:
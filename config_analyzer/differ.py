@@ -11,6 +11,25 @@ if TYPE_CHECKING:
     from .parser import Snapshot
 
 _log = get_logger("diff")
+
+
+class CachedSyntax(Syntax):
+    """``Syntax`` that runs the Pygments lexer once instead of on every render.
+
+    A cached diff is rendered once for its plain search lines and again for each
+    pane width it is shown at; only the line layout depends on the width.
+    """
+
+    _lexed = None  # ((code, line_range), Text)
+
+    def highlight(self, code, line_range=None):  # type: ignore[override]
+        key = (code, line_range)
+        if self._lexed is None or self._lexed[0] != key:
+            self._lexed = (key, super().highlight(code, line_range))
+        # Rich trims the returned Text in place on some paths; hand out a copy
+        return self._lexed[1].copy()
+
+
 def get_diff(snapshot1: "Snapshot", snapshot2: "Snapshot") -> Syntax:
     """
     Generates a unified diff between the content of two snapshots and wraps it
@@ -43,8 +62,23 @@ def get_diff(snapshot1: "Snapshot", snapshot2: "Snapshot") -> Syntax:
         len(lines2),
         len(diff_text),
     )
-    return Syntax(diff_text, "diff", line_numbers=True, word_wrap=True)
-    
+    return CachedSyntax(diff_text, "diff", line_numbers=True, word_wrap=True)
+
+
+def get_diff_preview(diff: Syntax, lines: int, tail: bool = False) -> Syntax:
+    """
+    Returns the first (or last) ``lines`` lines of a ``get_diff`` result.
+
+    Only that range is lexed, and numbering and gutter width match the full
+    diff, so the preview lines up with what later replaces it.
+    """
+    if tail:
+        total = diff.code.count("\n") + 1
+        line_range = (max(1, total - lines + 1), None)
+    else:
+        line_range = (1, lines)
+    return Syntax(diff.code, "diff", line_numbers=True, word_wrap=True, line_range=line_range)
+
 def get_diff_side_by_side(snapshot1: "Snapshot", snapshot2: "Snapshot", hide_unchanged: bool = False) -> Table:
     """
     Generates a side-by-side diff table between two snapshots.
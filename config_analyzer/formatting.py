@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
+# The same snapshot timestamps are formatted again for every directory listing
+# and every snapshot view launch; datetimes are hashable, so memoize.
+@lru_cache(maxsize=4096)
 def format_timestamp(dt: datetime) -> str:
     """Return a standardized string for timestamps (UTC, YYYY-MM-DD HH:MM TZ)."""
     if dt.tzinfo is None or (dt.tzinfo and dt.tzinfo.utcoffset(dt) is None):
@@ -10,4 +14,3 @@ def format_timestamp(dt: datetime) -> str:
     else:
         dt = dt.astimezone(timezone.utc)
     return dt.strftime("%Y-%m-%d %H:%M %Z")
-
@@ -13,6 +13,7 @@ def browser_bindings() -> list[Binding]:
         Binding("left", "go_up", "Up"),
         Binding("alt+up", "go_up", "Up"),
         Binding("ctrl+l", "toggle_layout", "Toggle Layout"),
+        Binding("ctrl+o", "load_full_preview", "", show=False),
         Binding("escape", "clear_filter", "", show=False),
         Binding("home", "cursor_home", "First"),
         Binding("end", "cursor_end", "Last"),
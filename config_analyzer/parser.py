@@ -1,28 +1,61 @@
 import os
 import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, NamedTuple, Tuple
+from typing import Optional, Tuple
 from dateutil.parser import parse as date_parse
 from .debug import get_logger
 
-# Using a NamedTuple for a lightweight, immutable data structure.
-class Snapshot(NamedTuple):
+try:
+    # Optional: RE2 matches in linear time, so pathological headers can't backtrack
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+# Frozen, slotted dataclass: immutable like a tuple but without per-instance
+# __dict__. Slots are declared by hand since dataclass(slots=True) needs 3.10+.
+@dataclass(frozen=True)
+class Snapshot:
     """Represents a single parsed configuration snapshot."""
+    __slots__ = ("path", "author", "timestamp", "content_body", "original_filename")
+
     path: str
     author: str
     timestamp: datetime
     content_body: str
     original_filename: str
 
+    # Frozen + __slots__ can't be unpickled via setattr; restore through object.__setattr__
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+def _compile(pattern: str):
+    """Compile with the fast engine when available, else stdlib ``re``.
+
+    Flags are given inline (``(?m)``, ``(?i)``) since RE2 doesn't take ``re`` flag values.
+    """
+    try:
+        return _regex_engine.compile(pattern)
+    except Exception:
+        return re.compile(pattern)
+
 # Pre-compiled regexes for efficiency.
-_CHANGE_CISCO_RE = re.compile(r"^\!\s*Last configuration change at\s*(.*?)\s*by\s*(\S+)\s*$", re.MULTILINE)
-_AUTHOR_HEADER_RE = re.compile(r"^(?:[#;!%\s]*)(?:Last\s*Updated\s*By|Updated-?by|Author|Owner|User(?:name)?|Changed-?by)\s*[:=-]\s*(.+)$", re.IGNORECASE)
-_DATE_HEADER_RE = re.compile(r"^(?:[#;!%\s]*)(?:Last\s*Updated|Updated|Date|Timestamp)\s*[:=-]\s*(.+)$", re.IGNORECASE)
-_FILENAME_DATE_RE = re.compile(r"(\d{4}[-_]?\d{2}[-_]?\d{2}[ T_]?\d{2}[:-]?\d{2}(?:[:-]?\d{2})?)")
-_FILENAME_USER_RE = re.compile(r"(?:user[-_])([A-Za-z0-9._-]+)|(?:^|__)by[-_]?([A-Za-z0-9._-]+)", re.IGNORECASE)
+_CHANGE_CISCO_RE = _compile(r"(?m)^\!\s*Last configuration change at\s*(.*?)\s*by\s*(\S+)\s*$")
+_AUTHOR_HEADER_RE = _compile(r"(?i)^(?:[#;!%\s]*)(?:Last\s*Updated\s*By|Updated-?by|Author|Owner|User(?:name)?|Changed-?by)\s*[:=-]\s*(.+)$")
+_DATE_HEADER_RE = _compile(r"(?i)^(?:[#;!%\s]*)(?:Last\s*Updated|Updated|Date|Timestamp)\s*[:=-]\s*(.+)$")
+_FILENAME_DATE_RE = _compile(r"(\d{4}[-_]?\d{2}[-_]?\d{2}[ T_]?\d{2}[:-]?\d{2}(?:[:-]?\d{2})?)")
+_FILENAME_USER_RE = _compile(r"(?i)(?:user[-_])([A-Za-z0-9._-]+)|(?:^|__)by[-_]?([A-Za-z0-9._-]+)")
 
 _log = get_logger("parser")
 
+# Metadata headers live at the top of a config; never scan past this many chars.
+_HEAD_SCAN_CHARS = 64 * 1024
+
 def _safe_read(path: str) -> Optional[str]:
     try:
         with open(path, "r", encoding="utf-8", errors="replace") as f:
@@ -31,14 +64,18 @@ def _safe_read(path: str) -> Optional[str]:
         _log.debug("safe_read: failed to read %s", path)
         return None
 
-def _safe_read_head(path: str, max_lines: int = 10) -> Optional[str]:
-    """Read up to max_lines from a file safely for metadata parsing."""
+def _safe_read_head(path: str, max_lines: int = 10, max_chars: int = _HEAD_SCAN_CHARS) -> Optional[str]:
+    """Read up to max_lines (within the first max_chars) from a file for metadata parsing."""
     try:
         out_lines = []
+        budget = max_chars
         with open(path, "r", encoding="utf-8", errors="replace") as f:
-            for i, line in enumerate(f):
-                if i >= max_lines:
+            # readline(limit) keeps a newline-free file from being read whole
+            while len(out_lines) < max_lines and budget > 0:
+                line = f.readline(budget)
+                if not line:
                     break
+                budget -= len(line)
                 out_lines.append(line.rstrip("\n"))
         return "\n".join(out_lines)
     except OSError:
@@ -46,6 +83,8 @@ def _safe_read_head(path: str, max_lines: int = 10) -> Optional[str]:
         return None
 
 def _extract_metadata_from_text(text: str) -> Tuple[Optional[str], Optional[datetime]]:
+    # Only the head matters; avoid regex/splitlines over multi-MB bodies
+    text = text[:_HEAD_SCAN_CHARS]
     # Cisco-style single line
     m = _CHANGE_CISCO_RE.search(text)
     if m:
@@ -88,22 +127,13 @@ def _extract_metadata_from_filename(filename: str) -> Tuple[Optional[str], Optio
         author = next((g for g in mu.groups() if g), None)
     return author, ts
 
-def parse_snapshot(file_path: str) -> Optional[Snapshot]:
-    """
-    Parse a configuration file to extract metadata and content heuristically.
+def _resolve_metadata(file_path: str, text: str, mtime_hint: Optional[float] = None) -> Tuple[str, datetime]:
+    """Resolve (author, UTC timestamp) from content, then filename, then mtime.
 
-    - Attempts Cisco-style header, generic headers, then filename hints.
-    - Falls back to file mtime for timestamp and "unknown" for author.
-    - Always returns a Snapshot if the file is readable.
+    ``mtime_hint`` lets callers that already stat'ed the file skip another stat.
     """
-    _log.debug("parse_snapshot: start path=%s", file_path)
-    full_content = _safe_read(file_path)
-    if full_content is None:
-        _log.debug("parse_snapshot: unreadable %s", file_path)
-        return None
-
     # Heuristic metadata extraction
-    author, ts = _extract_metadata_from_text(full_content)
+    author, ts = _extract_metadata_from_text(text)
     if ts is None or author is None:
         # Use filename hints where available
         f_author, f_ts = _extract_metadata_from_filename(os.path.basename(file_path))
@@ -114,18 +144,47 @@ def parse_snapshot(file_path: str) -> Optional[Snapshot]:
     if ts is None:
         try:
             # Use UTC-aware timestamp from file mtime
-            ts = datetime.fromtimestamp(os.path.getmtime(file_path), tz=timezone.utc)
+            mtime = mtime_hint if mtime_hint is not None else os.path.getmtime(file_path)
+            ts = datetime.fromtimestamp(mtime, tz=timezone.utc)
         except OSError:
             ts = datetime.now(timezone.utc)
     if author is None:
         author = "unknown"
-    _log.debug("parse_snapshot: meta author=%s ts=%s", author, ts)
+    # Authors repeat across a device's history; share one string object per name
+    author = sys.intern(author)
 
     # Normalize to timezone-aware UTC for consistent comparisons
     if ts.tzinfo is None or (ts.tzinfo and ts.tzinfo.utcoffset(ts) is None):
         ts = ts.replace(tzinfo=timezone.utc)
     else:
         ts = ts.astimezone(timezone.utc)
+    return author, ts
+
+def parse_snapshot(
+    file_path: str,
+    mtime_hint: Optional[float] = None,
+    metadata: Optional[Tuple[str, datetime]] = None,
+) -> Optional[Snapshot]:
+    """
+    Parse a configuration file to extract metadata and content heuristically.
+
+    - Attempts Cisco-style header, generic headers, then filename hints.
+    - Falls back to file mtime for timestamp and "unknown" for author.
+      Pass ``mtime_hint`` (e.g. from a DirEntry stat) to avoid an extra stat.
+    - A known (author, UTC timestamp) in ``metadata`` skips the heuristics.
+    - Always returns a Snapshot if the file is readable.
+    """
+    _log.debug("parse_snapshot: start path=%s", file_path)
+    full_content = _safe_read(file_path)
+    if full_content is None:
+        _log.debug("parse_snapshot: unreadable %s", file_path)
+        return None
+
+    if metadata is not None:
+        author, ts = metadata
+    else:
+        author, ts = _resolve_metadata(file_path, full_content, mtime_hint)
+    _log.debug("parse_snapshot: meta author=%s ts=%s", author, ts)
 
     # Determine where the real config body starts; strip common preambles
     lines = full_content.splitlines()
@@ -152,7 +211,7 @@ def parse_snapshot(file_path: str) -> Optional[Snapshot]:
     )
 
 
-def parse_snapshot_meta(file_path: str, head_lines: int = 10) -> Optional[Snapshot]:
+def parse_snapshot_meta(file_path: str, head_lines: int = 10, mtime_hint: Optional[float] = None) -> Optional[Snapshot]:
     """Parse only metadata (author, timestamp) from a configuration file.
 
     Reads only the head of the file and never the full content to keep it fast for
@@ -163,24 +222,7 @@ def parse_snapshot_meta(file_path: str, head_lines: int = 10) -> Optional[Snapsh
     if head is None:
         return None
 
-    author, ts = _extract_metadata_from_text(head)
-    if ts is None or author is None:
-        f_author, f_ts = _extract_metadata_from_filename(os.path.basename(file_path))
-        author = author or f_author
-        ts = ts or f_ts
-
-    if ts is None:
-        try:
-            ts = datetime.fromtimestamp(os.path.getmtime(file_path), tz=timezone.utc)
-        except OSError:
-            ts = datetime.now(timezone.utc)
-    if author is None:
-        author = "unknown"
-
-    if ts.tzinfo is None or (ts.tzinfo and ts.tzinfo.utcoffset(ts) is None):
-        ts = ts.replace(tzinfo=timezone.utc)
-    else:
-        ts = ts.astimezone(timezone.utc)
+    author, ts = _resolve_metadata(file_path, head, mtime_hint)
 
     return Snapshot(
         path=file_path,
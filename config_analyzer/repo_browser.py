@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache, partial
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Sequence, Union, Set
 
 from textual.app import App, ComposeResult
@@ -6,12 +8,14 @@ from textual.widgets import Header, Footer, DataTable, Static
 from textual.containers import Horizontal, Vertical, Container
 from textual.binding import Binding
 from textual import events
-import os
 from textual.timer import Timer
+from textual.worker import get_current_worker
 from rich.console import Console, Group, RenderableType
+from rich.text import Text
 from io import StringIO
 
-from .parser import parse_snapshot, parse_snapshot_meta
+from .parser import parse_snapshot, parse_snapshot_meta, Snapshot
+from .snapshot_cache import load_snapshot
 from .formatting import format_timestamp
 from .filter_mixin import FilterMixin
 from .keymap import browser_bindings
@@ -21,6 +25,28 @@ from .version import __version__
 from .search import SearchController
 from .widgets import SearchableTextPane
 
+# Shared cells for constant values: DataTable passes Text through as-is, whereas
+# plain strings are markup-parsed into a new Text every time a row is rendered.
+# Shared instances: never stylize/append to them in place.
+# Built like tui._plain_cell so both apps' tables lay cells out the same way.
+_UP_CELL = Text("..", no_wrap=True, end="")
+_DIR_CELL = Text("dir", no_wrap=True, end="")
+_DEV_CELL = Text("dev", no_wrap=True, end="")
+_EMPTY_CELL = Text("", no_wrap=True, end="")
+_PENDING_CELL = Text("...", style="dim", no_wrap=True, end="")
+
+
+@lru_cache(maxsize=128)
+def _cached_parse(path: str, mtime_ns: int, size: int) -> Optional[Snapshot]:
+    """Parse a config once per (path, mtime, size); edits change the key.
+
+    Re-highlighting a file or re-entering a directory is then served from memory;
+    with the opt-in snapshot cache, a cold start reuses parsed metadata.
+    The bound is lower than a pure metadata cache since full bodies are kept.
+    """
+    return load_snapshot(path, mtime_ns, size)
+
+
 class BrowserDataTable(DataTable):
     BINDINGS = [
         Binding("home", "goto_first_row", "First", show=False),
@@ -31,6 +57,8 @@ class BrowserDataTable(DataTable):
         Binding("alt+up", "go_up", "Up", show=False),
         Binding("right", "enter_selected", "Open", show=True),
     ]
+    VIEWPORT_HYDRATE_DELAY = 0.05
+    _viewport_timer: Optional[Timer] = None
     
     def action_goto_first_row(self) -> None:
         try:
@@ -58,6 +86,34 @@ class BrowserDataTable(DataTable):
         except Exception:
             pass
 
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:  # type: ignore[override]
+        """Hydrate rows scrolled into view by any means (scrollbar drag included).
+
+        Only the visible window gets metadata; coalesced so a drag hydrates once.
+        """
+        super().watch_scroll_y(old_value, new_value)
+        if int(old_value) == int(new_value):
+            return
+        if self._viewport_timer is not None:
+            try:
+                self._viewport_timer.stop()
+            except Exception:
+                pass
+        try:
+            self._viewport_timer = self.set_timer(self.VIEWPORT_HYDRATE_DELAY, self._hydrate_scrolled_viewport)
+        except Exception:
+            self._viewport_timer = None
+
+    def _hydrate_scrolled_viewport(self) -> None:
+        self._viewport_timer = None
+        try:
+            hydrate = getattr(self.app, "_hydrate_viewport", None)
+            if hydrate:
+                height = getattr(self.size, "height", 0) or 0
+                hydrate(center_row=int(self.scroll_y) + height // 2)
+        except Exception:
+            pass
+
     async def on_event(self, event: events.Event) -> Optional[bool]:  # type: ignore[override]
         try:
             handled = await super().on_event(event)
@@ -192,8 +248,12 @@ class RepoBrowserApp(FilterMixin, App):
     TITLE = "ConfigAnalyzer"
     SUB_TITLE = f"v{__version__} - Device Browser"
     FILTER_DEBOUNCE_SECONDS = 0.35
+    PREVIEW_DEBOUNCE_SECONDS = 0.08  # preview follows the cursor once it settles
+    META_HYDRATE_CHUNK = 50  # rows parsed per background step before yielding
     CONFIG_EXTS: Tuple[str, ...] = (".cfg", ".yml", ".yaml")
     MAX_PREVIEW_BYTES: int = 2_000_000  # 2 MB cap to avoid TUI stall on huge files
+    PREVIEW_INITIAL_CHARS: int = 256 * 1024  # first render; Ctrl+O loads up to the cap
+    SYNTAX_MAX_CHARS: int = 1_048_576  # above this the preview is shown as plain text
     """Simple repository browser.
 
     - Lists folders (excluding any named 'history').
@@ -263,6 +323,8 @@ class RepoBrowserApp(FilterMixin, App):
                 seen.add(abs_path)
 
         self.repo_roots = normalized
+        # Resolved once; _determine_repo_root runs on every directory change
+        self._repo_roots_real: List[Tuple[str, str]] = [(root, os.path.realpath(root)) for root in normalized]
         self._is_multi_root = len(self.repo_roots) > 1
         self.repo_labels = self._build_repo_labels(self.repo_roots, repo_names)
 
@@ -286,12 +348,18 @@ class RepoBrowserApp(FilterMixin, App):
         self._meta_cache: Dict[str, Tuple[str, str]] = {}
         self._pending_cursor_key: Optional[str] = None
         self._row_keys: List[str] = []
+        self._row_key_to_idx: Dict[str, int] = {}  # reverse of _row_keys
         self._entry_repo: Dict[str, str] = {}
         self._entry_types: Dict[str, str] = {}
         self._display_names: Dict[str, str] = {}
         self._filter_apply_timer: Optional[Timer] = None
+        self._preview_timer: Optional[Timer] = None
         self.preview_fullscreen: bool = False
+        # Split-view orientation container; None while the preview is fullscreen
+        self._layout_container: Optional[Container] = None
         self._last_preview_key: Optional[str] = None
+        # File the user asked to preview beyond PREVIEW_INITIAL_CHARS
+        self._full_preview_key: Optional[str] = None
         # Find-in-preview state
         self._search_target: str = ""  # 'preview' or ''
         self._preview_search: SearchController = SearchController()
@@ -349,7 +417,7 @@ class RepoBrowserApp(FilterMixin, App):
         self._update_tips()
 
     def on_mount(self) -> None:
-        self._setup_table()
+        # _apply_layout builds the real table and its columns
         self._apply_layout()
         self._filter_text = ""
         self._all_entries: List[str] = []
@@ -400,8 +468,7 @@ class RepoBrowserApp(FilterMixin, App):
             abs_path = os.path.realpath(path)
         except Exception:
             return None
-        for root in self.repo_roots:
-            r = os.path.realpath(root)
+        for root, r in self._repo_roots_real:
             if abs_path == r or abs_path.startswith(r + os.sep):
                 return root
         return None
@@ -415,23 +482,33 @@ class RepoBrowserApp(FilterMixin, App):
         self._display_names[path] = display_name
         self._entry_repo[path] = repo_root
 
+    def _is_dir_entry(self, path: str) -> bool:
+        """Entry type recorded from scandir; only unknown paths hit the filesystem."""
+        entry_type = self._entry_types.get(path)
+        if entry_type:
+            return entry_type == "dir"
+        return os.path.isdir(path)
+
     def _populate_single_repo_entries(self, repo_root: str, directory: str) -> None:
+        # scandir exposes the entry type from readdir, so no stat per entry
+        # Lowercase each name once; it serves as sort key and for the name checks
         try:
-            entries = sorted(os.listdir(directory), key=str.lower)
+            with os.scandir(directory) as it:
+                entries = [(e.name.lower(), e) for e in it]
         except OSError as e:
             self.preview.set_text(f"Error reading directory: {e}")
             return
+        entries.sort(key=itemgetter(0))
 
         dirs: List[Tuple[str, str]] = []
         files: List[Tuple[str, str]] = []
-        for name in entries:
-            full = os.path.join(directory, name)
-            if os.path.isdir(full):
-                if name.lower() == self.history_dir_l:
+        for name_l, entry in entries:
+            if entry.is_dir():
+                if name_l == self.history_dir_l:
                     continue
-                dirs.append((name, full))
-            elif os.path.isfile(full) and name.lower().endswith(self.CONFIG_EXTS):
-                files.append((name, full))
+                dirs.append((entry.name, entry.path))
+            elif name_l.endswith(self.CONFIG_EXTS) and entry.is_file():
+                files.append((entry.name, entry.path))
 
         for name, full in dirs:
             self._register_entry(full, name, "dir", repo_root)
@@ -446,28 +523,31 @@ class RepoBrowserApp(FilterMixin, App):
 
         for root in self.repo_roots:
             try:
-                entries = sorted(os.listdir(root), key=str.lower)
+                with os.scandir(root) as it:
+                    entries = list(it)
             except OSError as e:
-                self.logr.debug("listdir failed for %s: %s", root, e)
+                self.logr.debug("scandir failed for %s: %s", root, e)
                 continue
             label = self._label_for_root(root)
             label_l = (label or "").lower()
             self.logr.debug("populate_multi_root: root=%s label=%s entries=%s", root, label, len(entries))
-            for name in entries:
-                full = os.path.join(root, name)
+            for entry in entries:
+                name = entry.name
+                name_l = name.lower()
+                full = entry.path
                 if full in seen_paths:
                     continue
-                if os.path.isdir(full):
-                    if name.lower() == self.history_dir_l:
+                if entry.is_dir():
+                    if name_l == self.history_dir_l:
                         continue
                     seen_paths.add(full)
-                    ordered_dirs.append((label_l, name.lower(), name, full, root))
-                elif os.path.isfile(full) and name.lower().endswith(self.CONFIG_EXTS):
+                    ordered_dirs.append((label_l, name_l, name, full, root))
+                elif name_l.endswith(self.CONFIG_EXTS) and entry.is_file():
                     seen_paths.add(full)
-                    ordered_files.append((label_l, name.lower(), name, full, root))
+                    ordered_files.append((label_l, name_l, name, full, root))
 
-        ordered_dirs.sort(key=lambda item: (item[0], item[1]))
-        ordered_files.sort(key=lambda item: (item[0], item[1]))
+        ordered_dirs.sort(key=itemgetter(0, 1))
+        ordered_files.sort(key=itemgetter(0, 1))
 
         for _, _, name, full, root in ordered_dirs:
             self._register_entry(full, name, "dir", root)
@@ -494,8 +574,8 @@ class RepoBrowserApp(FilterMixin, App):
         content render state when switching containers immediately after start.
         """
         try:
-            for child in list(self.main_panel.children):
-                child.remove()
+            # One removal pass for the whole panel instead of one per child
+            self.main_panel.remove_children()
         except Exception:
             pass
 
@@ -520,6 +600,7 @@ class RepoBrowserApp(FilterMixin, App):
         if getattr(self, "preview_fullscreen", False):
             # Mount only the preview in fullscreen mode
             self.main_panel.mount(Container(self.preview))
+            self._layout_container = None
         else:
             if self.layout in ("right", "left"):
                 ordered = (self.preview, self.table) if self.layout == "left" else (self.table, self.preview)
@@ -528,6 +609,7 @@ class RepoBrowserApp(FilterMixin, App):
                 ordered = (self.preview, self.table) if self.layout == "top" else (self.table, self.preview)
                 container = Vertical(*ordered, classes=f"layout-{self.layout}")
             self.main_panel.mount(container)
+            self._layout_container = container
 
         # Columns for the fresh table
         self._setup_table()
@@ -539,6 +621,18 @@ class RepoBrowserApp(FilterMixin, App):
             except Exception:
                 pass
 
+    def _reorient_layout(self, container: Container) -> None:
+        """Switch the split orientation in place, keeping rows and preview as they are."""
+        # Horizontal and Vertical differ only in their layout rule
+        container.styles.layout = "horizontal" if self.layout in ("right", "left") else "vertical"
+        container.set_classes(f"layout-{self.layout}")
+        if self.preview.parent is container and self.table.parent is container:
+            if self.layout in ("left", "top"):
+                container.move_child(self.preview, before=self.table)
+            else:
+                container.move_child(self.preview, after=self.table)
+        self._update_tips()
+
     def _setup_table(self) -> None:
         t = self.table
         try:
@@ -555,6 +649,16 @@ class RepoBrowserApp(FilterMixin, App):
         t.add_column("User", key="user", width=16)
         t.add_column("Timestamp", key="timestamp")
         self._row_keys = []
+        self._row_key_to_idx = {}
+
+    def _clear_rows(self) -> None:
+        """Drop all rows but keep the columns set up by _setup_table."""
+        try:
+            self.table.clear()
+        except Exception:
+            pass
+        self._row_keys = []
+        self._row_key_to_idx = {}
 
     def _load_directory(self, path: Optional[str], repo_root: Optional[str] = None) -> None:
         if repo_root is None:
@@ -567,7 +671,8 @@ class RepoBrowserApp(FilterMixin, App):
             resolved_path = os.path.abspath(path)
 
         if repo_root:
-            repo_root = os.path.abspath(repo_root)
+            if repo_root not in self.repo_roots:
+                repo_root = os.path.abspath(repo_root)
             if resolved_path is None:
                 resolved_path = repo_root
             elif not (resolved_path == repo_root or resolved_path.startswith(repo_root + os.sep)):
@@ -599,10 +704,7 @@ class RepoBrowserApp(FilterMixin, App):
 
         self._filter_text = ""
         self._cancel_filter_timer()
-        try:
-            self.table.clear()
-        except Exception:
-            pass
+        # Rows are reset by _render_entries below
         self.preview.clear()
 
         self._all_entries = []
@@ -641,9 +743,8 @@ class RepoBrowserApp(FilterMixin, App):
         self._start_highlight_file = None
         self._highlight_dir_name = None
 
-    def _syntax_to_text(self, content: str, lang: str) -> "Text":
+    def _syntax_to_text(self, content: str, lang: str) -> Text:
         from rich.syntax import Syntax
-        from rich.text import Text
         # Render Syntax to ANSI, then parse to Text to keep styles
         buf = StringIO()
         console = Console(file=buf, force_terminal=True, color_system="truecolor", width=10_000)
@@ -652,6 +753,7 @@ class RepoBrowserApp(FilterMixin, App):
 
     def _update_preview(self, key: str) -> None:
         """Populate the right pane for a given key (file or directory)."""
+        self._cancel_preview_timer()
         self._last_preview_key = key
         self.preview.clear()
 
@@ -663,7 +765,7 @@ class RepoBrowserApp(FilterMixin, App):
             self._update_tips()
             return
 
-        if os.path.isdir(key):
+        if self._is_dir_entry(key):
             repo_label = self._label_for_root(self._entry_repo.get(key))
             if repo_label:
                 msg = f"Path: {key}\nRepository: {repo_label}\nEnter to navigate. Press Q to quit."
@@ -674,16 +776,22 @@ class RepoBrowserApp(FilterMixin, App):
             return
 
         try:
-            fsize = os.path.getsize(key)
+            st: Optional[os.stat_result] = os.stat(key)
+            fsize = st.st_size
         except OSError:
+            st = None
             fsize = 0
 
         from rich.syntax import Syntax
-        from rich.text import Text
 
         def _render_syntax(content: str, note: Optional[str] = None) -> None:
-            base_lang = "yaml" if key.lower().endswith((".yml", ".yaml")) else "ini"
-            renderable: RenderableType = Syntax(content, base_lang, word_wrap=False, line_numbers=False)
+            renderable: RenderableType
+            if len(content) > self.SYNTAX_MAX_CHARS:
+                # Pygments tokenizes the whole text up front; not worth it for huge files
+                renderable = Text(content)
+            else:
+                base_lang = "yaml" if key.lower().endswith((".yml", ".yaml")) else "ini"
+                renderable = Syntax(content, base_lang, word_wrap=False, line_numbers=False)
 
             # Clear the preview and set lines for search
             self.preview.clear()
@@ -701,12 +809,16 @@ class RepoBrowserApp(FilterMixin, App):
             self.preview._base_text = None
             self.preview.apply_search()
 
+        full = key == self._full_preview_key
+        expand_hint = "" if full else ", Ctrl+O=load more"
+        limit = self.MAX_PREVIEW_BYTES if full else self.PREVIEW_INITIAL_CHARS
+
         if fsize and fsize > self.MAX_PREVIEW_BYTES:
             try:
                 with open(key, "r", encoding="utf-8", errors="replace") as f:
-                    content = f.read(self.MAX_PREVIEW_BYTES)
+                    content = f.read(limit)
                 more = max(fsize - len(content), 0)
-                note = f"\n-- truncated preview ({more} more bytes) --" if more else None
+                note = f"\n-- truncated preview ({more} more bytes{expand_hint}) --" if more else None
                 _render_syntax(content, note=note)
                 self._update_tips()
             except Exception as exc:
@@ -714,26 +826,43 @@ class RepoBrowserApp(FilterMixin, App):
                 self._update_tips()
             return
 
-        snap = parse_snapshot(key)
+        snap = _cached_parse(key, st.st_mtime_ns, st.st_size) if st else parse_snapshot(key)
         if snap:
-            _render_syntax(snap.content_body)
+            body = snap.content_body
+            if len(body) > limit:
+                # Highlighting cost scales with content; only the first screens are visible
+                more = len(body) - limit
+                _render_syntax(body[:limit], note=f"\n-- truncated preview ({more} more chars{expand_hint}) --")
+            else:
+                _render_syntax(body)
             self._update_tips()
             return
 
         try:
             with open(key, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
+                content = f.read(limit)
             _render_syntax(content)
             self._update_tips()
         except OSError as exc:
             self.preview.set_text(f"Error reading file: {exc}")
             self._update_tips()
 
+    def action_load_full_preview(self) -> None:
+        """Re-render the current preview without the initial size cap."""
+        key = self._last_preview_key
+        if not key or key == ".." or key == self._full_preview_key:
+            return
+        self._full_preview_key = key
+        self._update_preview(key)
+
     def _selected_row_key(self) -> Optional[str]:
         row = self.table.cursor_row
-        if row is None or row < 0 or row >= len(self._row_keys):
+        if row is None or row < 0:
+            return None
+        try:
+            return self._row_keys[row]
+        except IndexError:
             return None
-        return self._row_keys[row]
 
     # -------- Filtering / Quick Search --------
     def _update_tips(self) -> None:
@@ -830,16 +959,14 @@ class RepoBrowserApp(FilterMixin, App):
         is_global_root = self._is_multi_root and self.current_root is None
         at_repo_root = bool(self.current_root) and self.current_rel == ""
 
-        self._setup_table()
+        self._clear_rows()
 
+        # Rows are collected first and added in one batch below
+        rows: List[Tuple[Tuple[object, ...], str]] = []
         if not ft:
-            if self._is_multi_root:
-                if not is_global_root:
-                    self.table.add_row("..", "..", "", "", "", key="..")
-                    self._row_keys.append("..")
-            elif not at_repo_root:
-                self.table.add_row("..", "..", "", "", "", key="..")
-                self._row_keys.append("..")
+            show_up = not is_global_root if self._is_multi_root else not at_repo_root
+            if show_up:
+                rows.append(((_UP_CELL, _UP_CELL, _EMPTY_CELL, _EMPTY_CELL, _EMPTY_CELL), ".."))
 
         filtered: List[str] = []
         if ft:
@@ -852,7 +979,7 @@ class RepoBrowserApp(FilterMixin, App):
                 if any(ft in val for val in candidates):
                     filtered.append(full)
                     continue
-                if os.path.isdir(full):
+                if self._entry_types.get(full) == "dir":
                     continue
                 author, ts, _ = self._get_metadata(full, eager=True)
                 if ft in author.lower() or ft in ts.lower():
@@ -861,15 +988,10 @@ class RepoBrowserApp(FilterMixin, App):
             filtered = list(self._all_entries)
 
         visible_limit = self._visible_limit()
-        tail_start = max(0, len(filtered) - visible_limit)
-        selection_index: Optional[int] = None
-        if selection_candidate and selection_candidate in filtered:
-            try:
-                selection_index = filtered.index(selection_candidate)
-            except ValueError:
-                selection_index = None
 
-        for idx, full in enumerate(filtered):
+        # Rows are added with cached metadata or placeholders only; the viewport is
+        # hydrated below and the rest is filled in by a background worker.
+        for full in filtered:
             display = self._display_names.get(full, os.path.basename(full))
             entry_type = self._entry_types.get(full)
             if not entry_type:
@@ -878,39 +1000,32 @@ class RepoBrowserApp(FilterMixin, App):
             repo_label = self._label_for_root(self._entry_repo.get(full))
 
             if entry_type == "dir":
-                self.table.add_row("dir", display, repo_label, "", "", key=full)
-                self._row_keys.append(full)
+                rows.append(((_DIR_CELL, display, repo_label, _EMPTY_CELL, _EMPTY_CELL), full))
                 continue
 
-            eager = (
-                idx < visible_limit
-                or idx >= tail_start
-                or (selection_candidate and full == selection_candidate)
-            )
-            if selection_index is not None and abs(idx - selection_index) <= visible_limit:
-                eager = True
-            author, ts, ready = self._get_metadata(full, eager=eager)
-            self.table.add_row("dev", display, repo_label, author, ts, key=full)
-            if not ready and eager:
-                self._pending_cursor_key = full
-            self._row_keys.append(full)
+            cached = self._meta_cache.get(full)
+            if cached:
+                rows.append(((_DEV_CELL, display, repo_label, cached[0], cached[1]), full))
+            else:
+                rows.append(((_DEV_CELL, display, repo_label, _PENDING_CELL, _PENDING_CELL), full))
+
+        self._row_keys = [key for _, key in rows]
+        self._row_key_to_idx = {key: idx for idx, key in enumerate(self._row_keys)}
+        # Hold screen updates until the whole listing is in the table
+        with self.batch_update():
+            for cells, key in rows:
+                self.table.add_row(*cells, key=key)
 
         self._update_tips()
 
         row_index: Optional[int] = None
-        if selection_candidate and selection_candidate in self._row_keys:
-            target_key = selection_candidate
+        if selection_candidate and selection_candidate in self._row_key_to_idx:
+            row_index = self._row_key_to_idx[selection_candidate]
         elif self._row_keys:
-            first_index = 0
-            if self._row_keys[0] == ".." and len(self._row_keys) > 1:
-                first_index = 1
-            target_key = self._row_keys[first_index]
-        else:
-            target_key = None
+            row_index = 1 if self._row_keys[0] == ".." and len(self._row_keys) > 1 else 0
 
-        if target_key:
+        if row_index is not None:
             try:
-                row_index = self._row_keys.index(target_key)
                 self.table.cursor_coordinate = (row_index, 0)
             except Exception:
                 pass
@@ -921,6 +1036,7 @@ class RepoBrowserApp(FilterMixin, App):
             current_cursor = 0
         center_row = row_index if row_index is not None else current_cursor
         self._hydrate_viewport(center_row=center_row, buffer=max(visible_limit // 2, 0))
+        self._schedule_background_hydrate()
 
         key = self._selected_row_key()
         if key:
@@ -931,12 +1047,13 @@ class RepoBrowserApp(FilterMixin, App):
     def _get_metadata(self, path: str, eager: bool) -> Tuple[str, str, bool]:
         if path in ("..",):
             return "", "", True
-        if os.path.isdir(path):
+        entry_type = self._entry_types.get(path)
+        if entry_type == "dir" or (entry_type is None and os.path.isdir(path)):
             return "", "", True
         cached = self._meta_cache.get(path)
         if cached:
             return cached[0], cached[1], True
-        if not os.path.isfile(path):
+        if entry_type is None and not os.path.isfile(path):
             return "", "", True
         if not eager:
             return "...", "...", False
@@ -992,7 +1109,7 @@ class RepoBrowserApp(FilterMixin, App):
                 key = self._row_keys[idx]
             except IndexError:
                 continue
-            if key == ".." or os.path.isdir(key) or key in self._meta_cache:
+            if key == ".." or key in self._meta_cache or self._is_dir_entry(key):
                 continue
             author, ts = self._load_metadata(key)
             pending.append((key, author, ts))
@@ -1007,10 +1124,60 @@ class RepoBrowserApp(FilterMixin, App):
                 self._render_entries()
                 return
 
+    def _schedule_background_hydrate(self) -> None:
+        """Fill metadata for rows outside the viewport without blocking input."""
+        keys = [
+            k for k in self._row_keys
+            if self._entry_types.get(k) == "dev" and k not in self._meta_cache
+        ]
+        if not keys:
+            return
+        try:
+            # exclusive: a newer listing cancels hydration of the previous one
+            self.run_worker(
+                partial(self._hydrate_remaining, keys),
+                group="meta-hydrate",
+                exclusive=True,
+                thread=True,
+            )
+        except Exception:
+            pass
+
+    def _hydrate_remaining(self, keys: List[str]) -> None:
+        """Worker thread: parse headers off the event loop, post cells back per chunk."""
+        worker = get_current_worker()
+        for start in range(0, len(keys), self.META_HYDRATE_CHUNK):
+            if worker.is_cancelled:
+                return
+            loaded: List[Tuple[str, str, str]] = []
+            for key in keys[start:start + self.META_HYDRATE_CHUNK]:
+                if key in self._meta_cache:
+                    continue
+                author, ts = self._load_metadata(key)
+                loaded.append((key, author, ts))
+            if not loaded or worker.is_cancelled:
+                continue
+            try:
+                if not self.call_from_thread(self._apply_metadata, loaded):
+                    return
+            except Exception:
+                # App is shutting down
+                return
+
+    def _apply_metadata(self, loaded: List[Tuple[str, str, str]]) -> bool:
+        for key, author, ts in loaded:
+            try:
+                self.table.update_cell(key, "user", author)
+                self.table.update_cell(key, "timestamp", ts)
+            except Exception:
+                # Rows were rebuilt underneath us; the new render reschedules
+                return False
+        return True
+
     def _ensure_metadata_for_key(self, key: str) -> bool:
         if key in ("..",):
             return False
-        if os.path.isdir(key):
+        if self._is_dir_entry(key):
             return False
         if key in self._meta_cache:
             return False
@@ -1172,9 +1339,14 @@ class RepoBrowserApp(FilterMixin, App):
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:  # type: ignore
         # Update preview when selection changes
         key = self._selected_row_key()
-        self.logr.debug("row_highlighted: %s", key)
         if not key:
             return
+        if key == self._last_preview_key:
+            # Textual re-posts highlights for the same row (e.g. after focus or refresh);
+            # also drops a pending preview when the cursor returns to the shown row
+            self._cancel_preview_timer()
+            return
+        self.logr.debug("row_highlighted: %s", key)
         if self._ensure_metadata_for_key(key):
             return
         try:
@@ -1182,6 +1354,34 @@ class RepoBrowserApp(FilterMixin, App):
         except Exception:
             cursor_row = 0
         self._hydrate_viewport(center_row=cursor_row, buffer=max(self._visible_limit() // 2, 0))
+        self._schedule_preview(key)
+
+    def _schedule_preview(self, key: str) -> None:
+        # Holding an arrow key highlights every row; only render where the cursor stops
+        self._cancel_preview_timer()
+        try:
+            self._preview_timer = self.set_timer(
+                self.PREVIEW_DEBOUNCE_SECONDS,
+                lambda: self._do_preview(key),
+                name="repo-browser-preview",
+            )
+        except Exception:
+            self._update_preview(key)
+
+    def _cancel_preview_timer(self) -> None:
+        timer = getattr(self, "_preview_timer", None)
+        if not timer:
+            return
+        try:
+            timer.stop()
+        except Exception:
+            pass
+        self._preview_timer = None
+
+    def _do_preview(self, key: str) -> None:
+        self._preview_timer = None
+        if key != self._selected_row_key():
+            return
         self._update_preview(key)
 
     def action_enter_selected(self) -> None:
@@ -1192,7 +1392,7 @@ class RepoBrowserApp(FilterMixin, App):
         if key == "..":
             self.action_go_up()
             return
-        if os.path.isdir(key):
+        if self._is_dir_entry(key):
             repo_root = self._entry_repo.get(key) or self._determine_repo_root(key) or self.current_root
             self._highlight_dir_name = os.path.basename(key)
             self._load_directory(key, repo_root=repo_root)
@@ -1284,6 +1484,11 @@ class RepoBrowserApp(FilterMixin, App):
             idx = 0
         self.layout = order[(idx + 1) % len(order)]
 
+        if self._layout_container is not None:
+            # No remount: the directory listing and preview stay loaded
+            self._reorient_layout(self._layout_container)
+            return
+
         # Remember current selection to restore after rebuild
         saved_key = self._selected_row_key()
 
@@ -1293,9 +1498,9 @@ class RepoBrowserApp(FilterMixin, App):
             target_root = self.current_root
             self._apply_layout()
             self._load_directory(target_path, repo_root=target_root)
-            if saved_key and saved_key in getattr(self, '_row_keys', []):
+            i = self._row_key_to_idx.get(saved_key) if saved_key else None
+            if i is not None:
                 try:
-                    i = self._row_keys.index(saved_key)
                     self.table.cursor_coordinate = (i, 0)
                     self._update_preview(saved_key)
                 except Exception:
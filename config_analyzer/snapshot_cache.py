@@ -0,0 +1,197 @@
+"""Opt-in on-disk cache of snapshot metadata so repeated launches skip re-parsing.
+
+Only the parsed author and timestamp are stored, keyed by absolute path and
+invalidated whenever the file's ``st_mtime_ns`` or ``st_size`` changes; config
+bodies are always read from the file itself. The cache is off unless
+``CONFIG_ANALYZER_CACHE`` is set: ``1``/``on`` uses
+``$XDG_CACHE_HOME/config-analyzer/snapshots.sqlite`` (``~/.cache`` by default),
+any other value is taken as the database path. The database is private to the
+user (0600, in a 0700 directory when created here) and trimmed to the most
+recently used ``MAX_ENTRIES`` rows. Databases made here carry an application id;
+an existing file without it is never modified, and the cache stays off instead.
+"""
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .debug import get_logger
+from .parser import Snapshot, parse_snapshot
+
+_log = get_logger("snapshot_cache")
+
+# Bump when the table layout changes; older databases are rebuilt
+_SCHEMA_VERSION = 2
+# PRAGMA application_id stamped on databases this module creates ("CAsc")
+_APPLICATION_ID = 0x43417363
+
+MAX_ENTRIES = 50_000
+# Puts between eviction passes
+_TRIM_EVERY = 1000
+
+_ON_VALUES = {"1", "on", "true", "yes"}
+_OFF_VALUES = {"", "0", "off", "false", "no"}
+
+
+def _default_location() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "config-analyzer", "snapshots.sqlite")
+
+
+def default_cache_path() -> Optional[str]:
+    env = os.environ.get("CONFIG_ANALYZER_CACHE")
+    if env is None or env.strip().lower() in _OFF_VALUES:
+        return None
+    if env.strip().lower() in _ON_VALUES:
+        return _default_location()
+    return env
+
+
+def _create_private(db_path: str) -> bool:
+    """Create the database file (and its directory) readable by the owner only.
+
+    Returns False when the file already exists; it is left untouched.
+    """
+    parent = os.path.dirname(db_path)
+    if parent and not os.path.isdir(parent):
+        os.makedirs(parent, mode=0o700)
+    try:
+        fd = os.open(db_path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    return True
+
+
+def _is_ours(conn: sqlite3.Connection, db_path: str) -> bool:
+    if conn.execute("PRAGMA application_id").fetchone()[0] == _APPLICATION_ID:
+        return True
+    # Unmarked caches from before the id existed only ever lived at the default
+    # location, which belongs to this tool; anywhere else the file is someone else's
+    return os.path.abspath(db_path) == os.path.abspath(_default_location())
+
+
+class SnapshotCache:
+    """SQLite-backed ``(path, mtime_ns, size) -> (author, timestamp)`` store.
+
+    Failures never propagate: an unusable database simply behaves as a miss.
+    The connection is shared between the UI thread and workers, guarded by a lock.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._puts = 0
+        conn: Optional[sqlite3.Connection] = None
+        try:
+            created = _create_private(db_path)
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            if not created and not _is_ours(conn, db_path):
+                conn.close()
+                _log.warning("snapshot cache disabled: %s exists and is not a config-analyzer cache", db_path)
+                return
+            # SQLite gives the -wal/-shm files the database file's mode
+            os.chmod(db_path, 0o600)
+            conn.execute(f"PRAGMA application_id={_APPLICATION_ID}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS snapshots")
+                # Earlier layouts held whole config bodies; don't leave them in free pages
+                conn.execute("VACUUM")
+                conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "path TEXT PRIMARY KEY, mtime INTEGER NOT NULL, size INTEGER NOT NULL, "
+                "author TEXT NOT NULL, timestamp TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS snapshots_used ON snapshots (used)")
+            self._trim(conn)
+            self._conn = conn
+        except (OSError, sqlite3.Error) as exc:
+            if conn is not None:
+                conn.close()
+            _log.warning("snapshot cache disabled (%s): %s", db_path, exc)
+
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[Tuple[str, datetime]]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT author, timestamp FROM snapshots WHERE path=? AND mtime=? AND size=?",
+                    (path, mtime_ns, size),
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute("UPDATE snapshots SET used=? WHERE path=?", (time.time_ns(), path))
+            return sys.intern(row[0]), datetime.fromisoformat(row[1])
+        except Exception as exc:
+            _log.debug("snapshot cache read failed for %s: %s", path, exc)
+            return None
+
+    def put(self, path: str, mtime_ns: int, size: int, author: str, timestamp: datetime) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (path, mtime, size, author, timestamp, used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, mtime_ns, size, author, timestamp.isoformat(), time.time_ns()),
+                )
+                self._puts += 1
+                if self._puts % _TRIM_EVERY == 0:
+                    self._trim(self._conn)
+        except Exception as exc:
+            _log.debug("snapshot cache write failed for %s: %s", path, exc)
+
+    @staticmethod
+    def _trim(conn: sqlite3.Connection) -> None:
+        """Drop the least recently used rows beyond MAX_ENTRIES."""
+        conn.execute(
+            "DELETE FROM snapshots WHERE path IN ("
+            "SELECT path FROM snapshots ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (MAX_ENTRIES,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+
+_CACHE: Optional[SnapshotCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_snapshot_cache() -> Optional[SnapshotCache]:
+    """Process-wide cache, opened on first use; None when not enabled."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            path = default_cache_path()
+            if not path:
+                return None
+            _CACHE = SnapshotCache(path)
+        return _CACHE
+
+
+def load_snapshot(file_path: str, mtime_ns: int, size: int) -> Optional[Snapshot]:
+    """``parse_snapshot`` reusing cached metadata for the given stat values."""
+    cache = get_snapshot_cache()
+    if cache is None:
+        return parse_snapshot(file_path, mtime_hint=mtime_ns / 1e9)
+    key = os.path.abspath(file_path)
+    metadata = cache.get(key, mtime_ns, size)
+    snap = parse_snapshot(file_path, mtime_hint=mtime_ns / 1e9, metadata=metadata)
+    if snap is not None and metadata is None:
+        cache.put(key, mtime_ns, size, snap.author, snap.timestamp)
+    return snap
@@ -1,20 +1,26 @@
-from typing import Optional
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Any, Optional
 
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, DataTable, Static
+from textual.widgets.data_table import ColumnKey, RowKey
 from textual.containers import Container, Horizontal, Vertical
 from textual.binding import Binding
 from textual.reactive import reactive
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from textual import events
 
 from .parser import Snapshot
 from .filter_mixin import FilterMixin
 from .debug import get_logger
 from .version import __version__
-from .differ import get_diff, get_diff_side_by_side
+from .differ import CachedSyntax, get_diff, get_diff_preview, get_diff_side_by_side
 from .keymap import snapshot_bindings
 from .tips import snapshot_tips
-from rich.syntax import Syntax
 from .formatting import format_timestamp
 from io import StringIO
 from rich.console import Console
@@ -23,6 +29,18 @@ from .search import SearchController
 from .widgets import SearchableTextPane
 import os
 
+# Selection column cells, shared across rows instead of rebuilt per toggle/render.
+# Shared instances: never stylize/append to them in place.
+_SELECTED_CELL = Text("x", style="green")
+_UNSELECTED_CELL = Text("")
+# update_cell wraps plain str keys on every call; these are built once
+_SELECTED_COL = ColumnKey("selected_col")
+
+
+def _plain_cell(value: object) -> Text:
+    """Literal single-line cell, as DataTable would format a non-markup value."""
+    return Text(str(value), no_wrap=True, end="")
+
 
 class DiffViewPane(SearchableTextPane):
     BINDINGS = [
@@ -158,6 +176,11 @@ class SelectionDataTable(DataTable):
             pass
 
     def action_goto_last_row(self) -> None:
+        try:
+            # Rows past the first screen may still be loading
+            self.app.finish_row_fill()  # type: ignore[attr-defined]
+        except Exception:
+            pass
         try:
             rc = self.row_count
             if rc:
@@ -221,6 +244,14 @@ class SelectionDataTable(DataTable):
 class CommitSelectorApp(FilterMixin, App):
     TITLE = "ConfigAnalyzer"
     SUB_TITLE = f"v{__version__} — Snapshot History"
+    DIFF_CACHE_SIZE = 32  # rendered diffs kept for re-selection / mode toggles
+    SELECTION_RENDER_DELAY = 0.075  # coalesces key-repeat toggles into one diff render
+    PREFETCH_DELAY = 0.15  # cursor must rest this long before a speculative diff starts
+    DIFF_PREVIEW_LINES = 200  # shown while a large unified diff is still being laid out
+    PRELOAD_PAIRS = 8  # newest adjacent snapshot pairs diffed in the background at startup
+    PRELOAD_MAX_CHARS = 4 * 1024 * 1024  # snapshot text those preloaded diffs may cover
+    ROW_FILL_FIRST = 200  # rows added synchronously; covers any realistic viewport
+    ROW_FILL_CHUNK = 500  # rows appended per event-loop turn afterwards
 
     DEFAULT_CSS = """
     #table-container, #diff_view {
@@ -251,6 +282,7 @@ class CommitSelectorApp(FilterMixin, App):
 
     show_hide_diff_key = reactive(False, layout=True)
     show_focus_next_key = reactive(False, layout=True)
+    diff_visible = reactive(False)
     # Dynamic footer hint visibility
     show_select_key = reactive(True)
     show_diff_controls_key = reactive(False)
@@ -275,10 +307,43 @@ class CommitSelectorApp(FilterMixin, App):
         super().__init__()
         self.logr = get_logger("tui")
         self._debug_keys = bool(os.environ.get("CN_TUI_DEBUG_KEYS"))
+        # Logger level is fixed at startup; skip debug calls on hot paths when off
+        self._dbg = self.logr.isEnabledFor(logging.DEBUG)
         self.snapshots_data = snapshots_data
+        # Row keys are snapshot paths; index once so diff/preview lookups are O(1)
+        self._by_path: dict[str, Snapshot] = {s.path: s for s in snapshots_data}
+        self._row_keys: dict[str, RowKey] = {p: RowKey(p) for p in self._by_path}
+        # Chronological rank per path (ties share a rank) so ordering a diff pair
+        # is an int compare rather than a datetime compare
+        self._ts_rank: dict[str, int] = {}
+        prev_ts = None
+        for i, s in enumerate(sorted(self._by_path.values(), key=lambda s: s.timestamp)):
+            if s.timestamp != prev_ts:
+                rank, prev_ts = i, s.timestamp
+            self._ts_rank[s.path] = rank
+        # (path, name, display timestamp, author, filter haystack) per snapshot in
+        # table order, so building rows on every filter keystroke is a plain loop
+        # over prepared tuples. Haystack fields are NUL-joined so a query never
+        # matches across two of them. Cells are prebuilt Text: DataTable parses
+        # plain str cells as markup every time it measures or renders them (and
+        # would mangle names containing '['). Shared; never stylize in place.
+        self._row_tuples: list[tuple[str, Text, Text, Text, str]] = [
+            (
+                s.path,
+                _plain_cell(s.original_filename),
+                _plain_cell(format_timestamp(s.timestamp)),
+                _plain_cell(s.author),
+                "\0".join((s.original_filename, s.author or "", str(s.timestamp))).lower(),
+            )
+            for s in snapshots_data
+        ]
+        # Rows of the current render not yet appended by the background fill
+        self._unfilled_rows: list[tuple[str, Text, Text, Text, str]] = []
         self.scroll_to_end = scroll_to_end
         self.layout = layout
-        self.selected_keys: list[str] = []
+        # Oldest-first selection (at most two for a diff) plus a set for O(1) membership
+        self.selected_keys: "deque[str]" = deque(maxlen=2)
+        self._selected_set: set[str] = set()
         self.ordered_keys: list[str] = []
         self.diff_mode: str = "unified"
         self.hide_unchanged_sbs: bool = False
@@ -288,17 +353,33 @@ class CommitSelectorApp(FilterMixin, App):
         self._search: SearchController = SearchController()
         self._diff_has_content: bool = False
         self._pending_diff_scroll: Optional[int] = None
-        self._pending_diff_focus: bool = False
+        # (renderable, plain lines) per (older path, newer path, mode, hide_unchanged),
+        # or per (path,) for a single-snapshot preview;
+        # snapshots are immutable for the app's lifetime, so entries never go stale.
+        # LRU-bounded: each entry holds a full rendered diff.
+        self._diff_cache: "OrderedDict[tuple, tuple[Any, list[str]]]" = OrderedDict()
+        self._diff_timer: Optional[Timer] = None
+        # Cache key of the diff being computed in the background, if any
+        self._diff_pending_key: Optional[tuple] = None
+        # Cache key of the diff currently shown in diff_view, if any
+        self._last_rendered_key: Optional[tuple] = None
+        # With one row selected, the diff against the highlighted row is computed
+        # ahead of the second Enter; show_diff adopts it if still running
+        self._prefetch_timer: Optional[Timer] = None
+        self._prefetch_key: Optional[tuple] = None
+        self._prefetch_target = 0
+        self._prefetch_preview: Any = None  # preview that arrived before adoption
+        # Orientation container holding table + diff; mounted once, then restyled
+        self._layout_container: Optional[Container] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
-        # Placeholders; actual layout is mounted in _apply_layout
+        # Mounted by _mount_layout inside the orientation container
         self.diff_view = DiffViewPane(id="diff_view", wrap=False)
+        # Matches diff_visible's initial False; its watcher only fires on change
+        self.diff_view.styles.visibility = "hidden"
         self.diff_view.can_focus = False
-        try:
-            self.diff_view.search = self._search
-        except Exception:
-            pass
+        self.diff_view.search = self._search
         self.table = SelectionDataTable(id="commit_table")
         self.table_container = Container(self.table, id="table-container")
         self.main_panel = Container(id="main-panel")
@@ -308,8 +389,9 @@ class CommitSelectorApp(FilterMixin, App):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.logr.debug("on_mount: layout=%s", self.layout)
-        self._apply_layout()
+        if self._dbg:
+            self.logr.debug("on_mount: layout=%s", self.layout)
+        self._mount_layout()
         self._filter_text: str = ""
         # Initialize footer hint flags
         self._update_focus_flags()
@@ -317,7 +399,8 @@ class CommitSelectorApp(FilterMixin, App):
         def _focus_table() -> None:
             try:
                 self.table.focus()
-                self.logr.debug("on_mount: focused table; rows=%s", getattr(self.table, 'row_count', 'n/a'))
+                if self._dbg:
+                    self.logr.debug("on_mount: focused table; rows=%s", getattr(self.table, 'row_count', 'n/a'))
             except Exception as e:
                 self.logr.exception("on_mount: table.focus failed: %s", e)
 
@@ -326,43 +409,15 @@ class CommitSelectorApp(FilterMixin, App):
         except Exception:
             _focus_table()
 
-    def _apply_layout(self) -> None:
-        """Rebuild widgets to avoid reparent timing issues on Textual 0.61."""
-        self.logr.debug("apply_layout: rebuild layout=%s", self.layout)
-        # Clear container
-        prev_scroll: Optional[int] = None
-        prev_focus = False
-        if hasattr(self, "diff_view") and getattr(self, "_diff_has_content", False):
-            try:
-                prev_scroll = self.diff_view.get_scroll_y()
-            except Exception:
-                prev_scroll = None
-            prev_focus = bool(getattr(self.diff_view, "has_focus", False))
-        self._pending_diff_scroll = prev_scroll
-        self._pending_diff_focus = prev_focus and bool(self.show_hide_diff_key)
-        try:
-            for child in list(self.main_panel.children):
-                child.remove()
-        except Exception:
-            pass
-
-        # Fresh widgets each time
-        self.diff_view = DiffViewPane(id="diff_view", wrap=False)
-        try:
-            self.diff_view.search = self._search
-        except Exception:
-            pass
-        if not self.show_hide_diff_key:
-            self.diff_view.styles.visibility = "hidden"
-            self.diff_view.can_focus = False
-        else:
-            self.diff_view.styles.visibility = "visible"
-            self.diff_view.can_focus = True
-
-        self.table = SelectionDataTable(id="commit_table")
-        self.table_container = Container(self.table, id="table-container")
+    def _mount_layout(self) -> None:
+        """Mount the compose-time table and diff panes in the startup orientation.
 
-        # Orientation
+        Runs once. Layout toggles go through _apply_layout, which restyles the
+        container and reorders its children (no reparenting, which misbehaved on
+        Textual 0.61), so table rows and the rendered diff are kept as they are.
+        """
+        if self._dbg:
+            self.logr.debug("mount_layout: layout=%s", self.layout)
         if self.layout in ("right", "left"):
             ordered = (self.diff_view, self.table_container) if self.layout == "left" else (self.table_container, self.diff_view)
             container = Horizontal(*ordered, classes=f"layout-{self.layout}")
@@ -370,47 +425,33 @@ class CommitSelectorApp(FilterMixin, App):
             ordered = (self.diff_view, self.table_container) if self.layout == "top" else (self.table_container, self.diff_view)
             container = Vertical(*ordered, classes=f"layout-{self.layout}")
         self.main_panel.mount(container)
-
-        # Populate table and reapply state
+        self._layout_container = container
         self.setup_table()
         self._update_tips()
-        for key in self.selected_keys:
-            try:
-                self.table.update_cell(key, "selected_col", Text("x", style="green"))
-            except Exception:
-                pass
-
-        if self.show_hide_diff_key and len(self.selected_keys) == 2:
-            self.show_diff()
-        elif self.show_hide_diff_key and len(self.selected_keys) == 1:
-            self.show_single()
-        else:
-            self._pending_diff_scroll = None
-
-        # Restore focus preference (diff pane if previously focused)
-        focused_diff = False
-        if self._pending_diff_focus and self.diff_view.styles.visibility == "visible":
-            try:
-                self.diff_view.focus()
-                focused_diff = True
-            except Exception:
-                focused_diff = False
-        if not focused_diff:
-            try:
-                self.table.focus()
-            except Exception:
-                pass
-        self._pending_diff_focus = False
+        # Initial focus is set by on_mount once the widgets are mounted
         self._update_focus_flags()
 
+    def _apply_layout(self) -> None:
+        container = self._layout_container
+        if container is None:
+            return
+        if self._dbg:
+            self.logr.debug("apply_layout: layout=%s", self.layout)
+        # Horizontal and Vertical differ only in their layout rule
+        container.styles.layout = "horizontal" if self.layout in ("right", "left") else "vertical"
+        container.set_classes(f"layout-{self.layout}")
+        if self.diff_view.parent is container and self.table_container.parent is container:
+            if self.layout in ("left", "top"):
+                container.move_child(self.diff_view, before=self.table_container)
+            else:
+                container.move_child(self.diff_view, after=self.table_container)
+        self._update_tips()
+
     def setup_table(self) -> None:
-        self.logr.debug("setup_table: %d snapshots", len(self.snapshots_data))
+        if self._dbg:
+            self.logr.debug("setup_table: %d snapshots", len(self.snapshots_data))
         table = self.table
-        # Clean model to avoid duplicate columns
-        try:
-            table.clear()
-        except Exception:
-            pass
+        # Runs once, on the empty compose-time table
         table.cursor_type = "row"
         table.add_column("Sel", key="selected_col", width=3)
         table.add_column("Name", key="name_col")
@@ -441,10 +482,7 @@ class CommitSelectorApp(FilterMixin, App):
         self._update_tips()
 
     def _update_focus_flags(self) -> None:
-        try:
-            diff_visible = self.diff_view.styles.visibility == "visible"
-        except Exception:
-            diff_visible = False
+        diff_visible = self.diff_visible
         # Enter hint when table focused
         self.show_select_key = bool(getattr(self.table, "has_focus", False))
         # D/H hints when diff visible and focused
@@ -452,32 +490,20 @@ class CommitSelectorApp(FilterMixin, App):
 
     def _render_rows(self) -> None:
         table = self.table
-        try:
-            table.clear(columns=False)
-        except Exception:
-            # If clear with columns arg unsupported, rebuild columns
-            table.clear()
-            table.add_column("Sel", key="selected_col", width=3)
-            table.add_column("Name", key="name_col")
-            table.add_column("Date", key="date_col")
-            table.add_column("Author", key="author_col")
-        self.ordered_keys = []
+        table.clear(columns=False)
         ft = (getattr(self, "_filter_text", "") or "").lower()
-        for snapshot in self.snapshots_data:
-            name = snapshot.original_filename
-            author = snapshot.author or ""
-            ts_str = str(snapshot.timestamp)
-            if ft and not (ft in name.lower() or ft in author.lower() or ft in ts_str.lower()):
-                continue
-            key = snapshot.path
-            self.ordered_keys.append(key)
-            table.add_row(
-                "x" if key in self.selected_keys else "",
-                name,
-                format_timestamp(snapshot.timestamp),
-                snapshot.author,
-                key=key,
-            )
+        rows = [t for t in self._row_tuples if ft in t[4]] if ft else self._row_tuples
+        # ordered_keys is always the full list; rows past the first screen are
+        # appended in the background, in order, so cursor_row indexing holds
+        self.ordered_keys = [t[0] for t in rows]
+        self._add_snapshot_rows(rows[:self.ROW_FILL_FIRST])
+        # A fresh list per render; the worker drains it and finish_row_fill empties it
+        self._unfilled_rows = rows[self.ROW_FILL_FIRST:]
+        if self._unfilled_rows:
+            # exclusive: a newer render (filter keystroke) cancels the old fill
+            self.run_worker(self._fill_rows(self._unfilled_rows), group="row-fill", exclusive=True)
+        else:
+            self.workers.cancel_group(self, "row-fill")
         # Reset cursor to first row
         try:
             if table.row_count:
@@ -486,6 +512,42 @@ class CommitSelectorApp(FilterMixin, App):
             pass
         self._update_tips()
 
+    def _add_snapshot_rows(self, rows: list[tuple[str, Text, Text, Text, str]]) -> None:
+        table = self.table
+        selected = self._selected_set
+        # Single batch so the screen is not refreshed while rows are going in
+        with self.batch_update():
+            for key, name, ts_display, author, _ in rows:
+                table.add_row(
+                    _SELECTED_CELL if key in selected else _UNSELECTED_CELL,
+                    name,
+                    ts_display,
+                    author,
+                    key=key,
+                )
+
+    async def _fill_rows(self, rows: list[tuple[str, Text, Text, Text, str]]) -> None:
+        while rows:
+            # Yield first so the initial screen paints before the bulk arrives
+            await asyncio.sleep(0)
+            chunk = rows[:self.ROW_FILL_CHUNK]
+            del rows[:self.ROW_FILL_CHUNK]
+            self._add_snapshot_rows(chunk)
+
+    def finish_row_fill(self) -> None:
+        """Append any rows the background fill has not reached yet, right away.
+
+        Jumping to the last row must land on the real last row, not the last one
+        loaded so far. Plain cursor moves just meet rows as they stream in.
+        """
+        rows = self._unfilled_rows
+        if not rows:
+            return
+        rest = rows[:]
+        rows.clear()
+        self.workers.cancel_group(self, "row-fill")
+        self._add_snapshot_rows(rest)
+
     def on_key(self, event: events.Key) -> None:  # type: ignore
         # Delegate to mixin; consume if handled (only when table focused)
         if self._debug_keys:
@@ -510,9 +572,17 @@ class CommitSelectorApp(FilterMixin, App):
             # Let App-level Binding handle; no-op here
             return
 
+    def watch_diff_visible(self, visible: bool) -> None:
+        self.diff_view.styles.visibility = "visible" if visible else "hidden"
+        # Tab can reach the pane while shown; showing it never takes focus
+        self.diff_view.can_focus = visible
+
     def show_diff(self) -> None:
-        self.show_hide_diff_key = True
-        self.show_focus_next_key = True
+        # Pane and footer flags change together; batch them so the screen refreshes once
+        with self.batch_update():
+            self.diff_visible = True
+            self.show_hide_diff_key = True
+            self.show_focus_next_key = True
 
         restore_scroll = self._pending_diff_scroll
         self._pending_diff_scroll = None
@@ -524,22 +594,250 @@ class CommitSelectorApp(FilterMixin, App):
                 prev_scroll = 0
 
         path1, path2 = self.selected_keys
-        snapshot1 = next(s for s in self.snapshots_data if s.path == path1)
-        snapshot2 = next(s for s in self.snapshots_data if s.path == path2)
-        if snapshot1.timestamp > snapshot2.timestamp:
-            snapshot1, snapshot2 = snapshot2, snapshot1
+        if self._ts_rank[path1] > self._ts_rank[path2]:
+            path1, path2 = path2, path1
+        snapshot1 = self._by_path[path1]
+        snapshot2 = self._by_path[path2]
+
+        target = self._scroll_target(restore_scroll, prev_scroll)
+        key = self._diff_key(snapshot1, snapshot2)
+        if key == self._last_rendered_key and self._diff_has_content:
+            # Same pair and mode already on screen; a rewrite would only repaint it
+            self._diff_pending_key = None
+            return
+        cached = self._diff_cache.get(key)
+        if cached is not None:
+            self._diff_cache.move_to_end(key)
+            self._diff_pending_key = None
+            self._install_diff(key, cached, target)
+            return
 
-        if self.diff_mode == "side-by-side":
-            renderable = get_diff_side_by_side(snapshot1, snapshot2, hide_unchanged=self.hide_unchanged_sbs)
+        # Diffing large configs takes a while; keep the UI responsive meanwhile
+        self._diff_pending_key = key
+        self._last_rendered_key = None
+        self._diff_has_content = False
+        self.diff_view.set_text("Computing diff...")
+        if key == self._prefetch_key:
+            # Already being computed speculatively; installed when it arrives
+            self._prefetch_target = target
+            if self._prefetch_preview is not None:
+                self._on_diff_preview(key, self._prefetch_preview)
         else:
-            renderable = get_diff(snapshot1, snapshot2)
+            self.run_worker(
+                partial(self._compute_diff_in_thread, key, snapshot1, snapshot2, target, self.diff_view.content_width()),
+                group="diff",
+                exclusive=True,
+                thread=True,
+            )
+        self._update_focus_flags()
+        self._update_tips()
+
+    def _scroll_target(self, restore_scroll: Optional[int], prev_scroll: int) -> int:
+        """Offset to open new pane content at; 0 means the top, or the end with --scroll-to-end."""
+        if restore_scroll is not None:
+            # Re-render of the same content (mode toggle): keep the reader's place
+            return restore_scroll
+        if self.scroll_to_end:
+            # A different document; the previous offset means nothing in it
+            return 0
+        return prev_scroll
+
+    def _diff_key(self, snapshot1: Snapshot, snapshot2: Snapshot) -> tuple:
+        side_by_side = self.diff_mode == "side-by-side"
+        return (snapshot1.path, snapshot2.path, self.diff_mode, side_by_side and self.hide_unchanged_sbs)
+
+    def _compute_diff_in_thread(
+        self, key: tuple, snapshot1: Snapshot, snapshot2: Snapshot, target: int, width: Optional[int]
+    ) -> None:
+        result = self._compute_diff_with_preview(key, snapshot1, snapshot2)
+        if result is None:
+            return
+        # Past the streaming threshold the pane paints its first screen sooner
+        # by streaming than by waiting here for the whole layout
+        streams = len(result[1]) > self.diff_view.STREAM_MIN_LINES
+        rendered = None if streams else self._prerender_diff(result, width)
+        if get_current_worker().is_cancelled:
+            return
+        try:
+            self.call_from_thread(self._on_diff_computed, key, result, target, rendered)
+        except Exception:
+            # App is shutting down
+            pass
+
+    def _prerender_diff(self, result: tuple[Any, list[str]], width: Optional[int]) -> Optional[tuple]:
+        """Lay the diff out for the pane while still off the UI thread."""
+        if not width or get_current_worker().is_cancelled:
+            return None
+        try:
+            return (width, self.diff_view.prerender(result[0], width))
+        except Exception:
+            # Falls back to rendering (streamed) on the UI thread
+            return None
+
+    def _compute_diff_with_preview(
+        self, key: tuple, snapshot1: Snapshot, snapshot2: Snapshot
+    ) -> Optional[tuple[Any, list[str]]]:
+        """_compute_diff, posting the first screen of a large unified diff early.
+
+        Producing the search lines is a full render of the diff, which for large
+        diffs takes longer than the diff itself. Returns None once cancelled.
+        """
+        renderable = self._build_diff(snapshot1, snapshot2, key[2], key[3])
+        if get_current_worker().is_cancelled:
+            return None
+        if isinstance(renderable, CachedSyntax) and renderable.code.count("\n") > self.diff_view.STREAM_MIN_LINES:
+            # The end the pane will open at
+            preview = get_diff_preview(renderable, self.DIFF_PREVIEW_LINES, tail=self.scroll_to_end)
+            try:
+                self.call_from_thread(self._on_diff_preview, key, preview)
+            except Exception:
+                # App is shutting down
+                return None
+        return renderable, self._plain_lines(renderable)
+
+    def _on_diff_preview(self, key: tuple, preview: Any) -> None:
+        if key != self._diff_pending_key:
+            if key == self._prefetch_key:
+                # Speculative; shown if show_diff adopts it before it completes
+                self._prefetch_preview = preview
+            return
+        self.diff_view.clear()
+        self.diff_view.set_renderable(preview)
+
+    def _on_diff_computed(
+        self, key: tuple, result: tuple[Any, list[str]], target: int, rendered: Optional[tuple] = None
+    ) -> None:
+        if rendered is not None:
+            width, lines = rendered
+            self.diff_view.add_prerendered(result[0], width, lines)
+        self._diff_cache[key] = result
+        if len(self._diff_cache) > self.DIFF_CACHE_SIZE:
+            self._diff_cache.popitem(last=False)
+        # Selection, mode or panel may have changed while computing
+        if key != self._diff_pending_key:
+            return
+        self._diff_pending_key = None
+        self._install_diff(key, result, target)
+
+    # ---- Speculative diff prefetch ----
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        self._cancel_prefetch_timer()
+        if len(self.selected_keys) != 1:
+            return
+        path = getattr(event.row_key, "value", None)
+        if path is None or path == self.selected_keys[0]:
+            return
+        try:
+            self._prefetch_timer = self.set_timer(self.PREFETCH_DELAY, partial(self._prefetch_diff, path))
+        except Exception:
+            pass
+
+    def _cancel_prefetch_timer(self) -> None:
+        if self._prefetch_timer is None:
+            return
+        try:
+            self._prefetch_timer.stop()
+        except Exception:
+            pass
+        self._prefetch_timer = None
+
+    def _prefetch_diff(self, path: str) -> None:
+        self._prefetch_timer = None
+        if len(self.selected_keys) != 1 or path == self.selected_keys[0] or path not in self._by_path:
+            return
+        path1, path2 = self.selected_keys[0], path
+        if self._ts_rank[path1] > self._ts_rank[path2]:
+            path1, path2 = path2, path1
+        snapshot1 = self._by_path[path1]
+        snapshot2 = self._by_path[path2]
+        key = self._diff_key(snapshot1, snapshot2)
+        if key in self._diff_cache or key == self._prefetch_key or key == self._diff_pending_key:
+            return
+        self._prefetch_key = key
+        self._prefetch_target = 0
+        self._prefetch_preview = None
+        # exclusive: moving on to another row drops the previous speculation
+        self.run_worker(
+            partial(self._prefetch_in_thread, key, snapshot1, snapshot2, self.diff_view.content_width()),
+            group="diff-prefetch",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _prefetch_in_thread(self, key: tuple, snapshot1: Snapshot, snapshot2: Snapshot, width: Optional[int]) -> None:
+        result = self._compute_diff_with_preview(key, snapshot1, snapshot2)
+        if result is None:
+            return
+        # Nobody is waiting yet, so lay out even large diffs ahead of time
+        rendered = self._prerender_diff(result, width)
+        if get_current_worker().is_cancelled:
+            return
+        try:
+            self.call_from_thread(self._on_prefetched, key, result, rendered)
+        except Exception:
+            pass
+
+    def _on_prefetched(self, key: tuple, result: tuple[Any, list[str]], rendered: Optional[tuple]) -> None:
+        if key == self._prefetch_key:
+            self._prefetch_key = None
+            self._prefetch_preview = None
+        # Caches it, and installs it if show_diff adopted this computation
+        self._on_diff_computed(key, result, self._prefetch_target, rendered)
+
+    # ---- Startup preload of adjacent pairs ----
+    def on_ready(self) -> None:
+        # Consecutive snapshots are the usual comparison; have the newest ready
+        pairs = self._adjacent_pairs()
+        if pairs:
+            self.run_worker(partial(self._preload_in_thread, pairs), group="diff-preload", thread=True)
+
+    def _adjacent_pairs(self) -> list[tuple[tuple, Snapshot, Snapshot]]:
+        """(key, older, newer) for the newest PRELOAD_PAIRS pairs, within PRELOAD_MAX_CHARS."""
+        rank = self._ts_rank
+        ordered = sorted(self.snapshots_data, key=lambda s: rank[s.path], reverse=True)
+        pairs: list[tuple[tuple, Snapshot, Snapshot]] = []
+        budget = self.PRELOAD_MAX_CHARS
+        for newer, older in zip(ordered, ordered[1:]):
+            if len(pairs) >= self.PRELOAD_PAIRS:
+                break
+            if rank[newer.path] == rank[older.path]:
+                # show_diff keeps selection order for ties, so the key is unknown
+                continue
+            key = self._diff_key(older, newer)
+            if key in self._diff_cache or key == self._diff_pending_key or key == self._prefetch_key:
+                # Already there or on its way; diffing it again would only compete
+                continue
+            budget -= len(newer.content_body) + len(older.content_body)
+            if budget < 0:
+                break
+            pairs.append((key, older, newer))
+        return pairs
+
+    def _preload_in_thread(self, pairs: list[tuple[tuple, Snapshot, Snapshot]]) -> None:
+        worker = get_current_worker()
+        for key, snapshot1, snapshot2 in pairs:
+            if worker.is_cancelled:
+                return
+            result = self._compute_diff(snapshot1, snapshot2, key[2], key[3])
+            try:
+                self.call_from_thread(self._on_preloaded, key, result)
+            except Exception:
+                return
+
+    def _on_preloaded(self, key: tuple, result: tuple[Any, list[str]]) -> None:
+        # Only fills spare room: never evicts a diff the user has looked at.
+        # Not laid out ahead: the pane's render cache is far smaller than this
+        if key in self._diff_cache or len(self._diff_cache) >= self.DIFF_CACHE_SIZE:
+            return
+        self._diff_cache[key] = result
+
+    def _install_diff(self, key: tuple, diff: tuple[Any, list[str]], target: int) -> None:
+        renderable, raw_lines = diff
+        self._last_rendered_key = key
 
         # Clear and set the raw text for search
         self.diff_view.clear()
-        raw_buf = StringIO()
-        Console(file=raw_buf, force_terminal=False, color_system=None, width=10_000).print(renderable)
-        raw_text = raw_buf.getvalue()
-        self.diff_view._lines = raw_text.splitlines()
+        self.diff_view._lines = raw_lines
         if self.diff_view.search:
             self.diff_view.search.set_lines(self.diff_view._lines)
 
@@ -552,29 +850,62 @@ class CommitSelectorApp(FilterMixin, App):
 
         self._diff_has_content = True
 
-        self.diff_view.styles.visibility = "visible"
-        self.diff_view.can_focus = True  # allow Tab focus, but don't take focus now
+        self.diff_visible = True
         if self._search_active and self._search.has_query():
             try:
                 self.diff_view.scroll_match_into_view(center=False)
             except Exception:
                 pass
         else:
-            target = restore_scroll if restore_scroll is not None else prev_scroll
             if target:
                 try:
                     self.diff_view.scroll_to_y(target)
                 except Exception:
                     pass
+            elif self.scroll_to_end:
+                # Once, after the write; a streamed write defers it to the last chunk
+                try:
+                    self.diff_view.scroll_to_bottom()
+                except Exception:
+                    pass
         self._update_focus_flags()
         self._update_tips()
 
+    @staticmethod
+    def _compute_diff(snapshot1: Snapshot, snapshot2: Snapshot, mode: str, hide_unchanged: bool) -> tuple[Any, list[str]]:
+        """Return (renderable, plain lines) for a pair; runs in a worker thread.
+
+        The plain lines feed search; producing them means a full Rich/Pygments
+        render, so they are cached with the renderable rather than redone per show.
+        """
+        renderable = CommitSelectorApp._build_diff(snapshot1, snapshot2, mode, hide_unchanged)
+        return renderable, CommitSelectorApp._plain_lines(renderable)
+
+    @staticmethod
+    def _build_diff(snapshot1: Snapshot, snapshot2: Snapshot, mode: str, hide_unchanged: bool) -> Any:
+        if mode == "side-by-side":
+            return get_diff_side_by_side(snapshot1, snapshot2, hide_unchanged=hide_unchanged)
+        return get_diff(snapshot1, snapshot2)
+
+    @staticmethod
+    def _plain_lines(renderable: Any) -> list[str]:
+        raw_buf = StringIO()
+        Console(file=raw_buf, force_terminal=False, color_system=None, width=10_000).print(renderable)
+        return raw_buf.getvalue().splitlines()
+
+    def on_unmount(self) -> None:
+        self._diff_cache.clear()
+
     def hide_diff_panel(self) -> None:
-        self.logr.debug("hide_diff_panel")
-        self.diff_view.styles.visibility = "hidden"
-        self.diff_view.can_focus = False
-        self.show_hide_diff_key = False
-        self.show_focus_next_key = False
+        if self._dbg:
+            self.logr.debug("hide_diff_panel")
+        self._cancel_diff_timer()
+        self._diff_pending_key = None
+        self._last_rendered_key = None
+        with self.batch_update():
+            self.diff_visible = False
+            self.show_hide_diff_key = False
+            self.show_focus_next_key = False
         self._diff_has_content = False
         if self._search_active:
             self._search_active = False
@@ -592,15 +923,17 @@ class CommitSelectorApp(FilterMixin, App):
 
     def action_hide_diff(self) -> None:
         # If diff visible, hide and clear selection; otherwise, go back to repo
-        if self.diff_view.styles.visibility == "visible":
+        if self.diff_visible:
             self.hide_diff_panel()
-            for key in list(self.selected_keys):
-                try:
-                    self.table.update_cell(key, "selected_col", "")
-                except Exception:
-                    # Table may have been filtered or rows rebuilt; ignore
-                    pass
+            with self.batch_update():
+                for key in self.selected_keys:
+                    try:
+                        self._set_mark(key, _UNSELECTED_CELL)
+                    except Exception:
+                        # Table may have been filtered or rows rebuilt; ignore
+                        pass
             self.selected_keys.clear()
+            self._selected_set.clear()
         else:
             self.action_go_back()
 
@@ -679,22 +1012,58 @@ class CommitSelectorApp(FilterMixin, App):
     def action_toggle_row(self) -> None:
         table = self.table
         if not table.has_focus:
-            self.logr.debug("toggle_row: table not focused; ignoring")
+            if self._dbg:
+                self.logr.debug("toggle_row: table not focused; ignoring")
             return
         try:
             row_key = self.ordered_keys[table.cursor_row]
         except IndexError:
-            self.logr.debug("toggle_row: cursor out of range")
+            if self._dbg:
+                self.logr.debug("toggle_row: cursor out of range")
             return
-        if row_key in self.selected_keys:
-            self.selected_keys.remove(row_key)
-            table.update_cell(row_key, "selected_col", "")
+        selected, selected_set = self.selected_keys, self._selected_set
+        if row_key in selected_set:
+            selected.remove(row_key)
+            selected_set.discard(row_key)
+            self._set_mark(row_key, _UNSELECTED_CELL)
         else:
-            if len(self.selected_keys) >= 2:
-                oldest_key = self.selected_keys.pop(0)
-                table.update_cell(oldest_key, "selected_col", "")
-            self.selected_keys.append(row_key)
-            table.update_cell(row_key, "selected_col", Text("x", style="green"))
+            # Evicting the oldest mark and setting the new one is one visual change
+            with self.batch_update():
+                if len(selected) == selected.maxlen:
+                    # append() below evicts the oldest; clear its mark first
+                    oldest_key = selected[0]
+                    selected_set.discard(oldest_key)
+                    self._set_mark(oldest_key, _UNSELECTED_CELL)
+                selected.append(row_key)
+                selected_set.add(row_key)
+                self._set_mark(row_key, _SELECTED_CELL)
+        # Emptying the selection goes through the same timer, so a quick
+        # off/on of one row hides and re-shows the pane at most once
+        self._schedule_selection_render()
+
+    def _set_mark(self, key: str, cell: Text) -> None:
+        # The Sel column has a fixed width; never ask for a width recalculation
+        self.table.update_cell(self._row_keys.get(key) or RowKey(key), _SELECTED_COL, cell, update_width=False)
+
+    def _schedule_selection_render(self) -> None:
+        # Marks update immediately; the diff/preview only for the settled selection
+        self._cancel_diff_timer()
+        try:
+            self._diff_timer = self.set_timer(self.SELECTION_RENDER_DELAY, self._render_selection)
+        except Exception:
+            self._render_selection()
+
+    def _cancel_diff_timer(self) -> None:
+        if self._diff_timer is None:
+            return
+        try:
+            self._diff_timer.stop()
+        except Exception:
+            pass
+        self._diff_timer = None
+
+    def _render_selection(self) -> None:
+        self._diff_timer = None
         if len(self.selected_keys) == 2:
             self.show_diff()
         elif len(self.selected_keys) == 1:
@@ -708,11 +1077,15 @@ class CommitSelectorApp(FilterMixin, App):
             path = self.selected_keys[-1]
         except IndexError:
             return
-        try:
-            snap = next(s for s in self.snapshots_data if s.path == path)
-        except StopIteration:
+        snap = self._by_path.get(path)
+        if snap is None:
             return
-        self.show_hide_diff_key = True
+        with self.batch_update():
+            self.diff_visible = True
+            self.show_hide_diff_key = True
+        # Drop any diff still being computed for the previous selection
+        self._diff_pending_key = None
+        self._last_rendered_key = None
 
         restore_scroll = self._pending_diff_scroll
         self._pending_diff_scroll = None
@@ -723,15 +1096,26 @@ class CommitSelectorApp(FilterMixin, App):
             except Exception:
                 prev_scroll = 0
 
+        # Reuse the renderable for this snapshot so the pane's rendered-lines
+        # cache recognises it when the same preview is shown again
+        key = (path,)
+        cached = self._diff_cache.get(key)
+        if cached is None:
+            renderable = CachedSyntax(snap.content_body, "ini", word_wrap=False, line_numbers=False)
+            cached = (renderable, snap.content_body.splitlines())
+            self._diff_cache[key] = cached
+            if len(self._diff_cache) > self.DIFF_CACHE_SIZE:
+                self._diff_cache.popitem(last=False)
+        else:
+            self._diff_cache.move_to_end(key)
+        renderable, raw_lines = cached
+
         # Clear and set the raw text for search
         self.diff_view.clear()
-        self.diff_view._lines = snap.content_body.splitlines()
+        self.diff_view._lines = raw_lines
         if self.diff_view.search:
             self.diff_view.search.set_lines(self.diff_view._lines)
 
-        # Create syntax highlighted renderable
-        from rich.syntax import Syntax
-        renderable = Syntax(snap.content_body, "ini", word_wrap=False, line_numbers=False)
         self.diff_view._renderable = renderable
         self.diff_view._base_text = None
 
@@ -739,32 +1123,37 @@ class CommitSelectorApp(FilterMixin, App):
         self.diff_view.apply_search()
 
         self._diff_has_content = True
-        self.diff_view.styles.visibility = "visible"
-        self.diff_view.can_focus = True
         if self._search_active and self._search.has_query():
             try:
                 self.diff_view.scroll_match_into_view(center=False)
             except Exception:
                 pass
         else:
-            target = restore_scroll if restore_scroll is not None else prev_scroll
+            target = self._scroll_target(restore_scroll, prev_scroll)
             if target:
                 try:
                     self.diff_view.scroll_to_y(target)
                 except Exception:
                     pass
+            elif self.scroll_to_end:
+                try:
+                    self.diff_view.scroll_to_bottom()
+                except Exception:
+                    pass
         self._update_focus_flags()
         self._update_tips()
         
     def action_toggle_diff_mode(self) -> None:
         self.diff_mode = "side-by-side" if self.diff_mode == "unified" else "unified"
-        if len(self.selected_keys) == 2 and self.diff_view.styles.visibility == "visible":
-            if self._diff_has_content:
-                try:
-                    self._pending_diff_scroll = self.diff_view.get_scroll_y()
-                except Exception:
-                    self._pending_diff_scroll = None
-            self.show_diff()
+        # Without a visible pair the new mode just applies to the next diff
+        if len(self.selected_keys) != 2 or not self.diff_visible:
+            return
+        if self._diff_has_content:
+            try:
+                self._pending_diff_scroll = self.diff_view.get_scroll_y()
+            except Exception:
+                self._pending_diff_scroll = None
+        self.show_diff()
 
     def action_toggle_layout(self) -> None:
         order = ["right", "bottom", "left", "top"]
@@ -773,14 +1162,8 @@ class CommitSelectorApp(FilterMixin, App):
         except ValueError:
             idx = 0
         self.layout = order[(idx + 1) % len(order)]
-
-        def _remount() -> None:
-            self._apply_layout()
-
-        try:
-            self.call_after_refresh(_remount)
-        except Exception:
-            _remount()
+        # Restyles in place; nothing is remounted
+        self._apply_layout()
 
     # ---- Find support ----
     def action_start_find(self) -> None:
@@ -855,7 +1238,7 @@ class CommitSelectorApp(FilterMixin, App):
 
     def action_toggle_hide_unchanged(self) -> None:
         self.hide_unchanged_sbs = not self.hide_unchanged_sbs
-        if self.diff_mode == "side-by-side" and len(self.selected_keys) == 2 and self.diff_view.styles.visibility == "visible":
+        if self.diff_mode == "side-by-side" and len(self.selected_keys) == 2 and self.diff_visible:
             if self._diff_has_content:
                 try:
                     self._pending_diff_scroll = self.diff_view.get_scroll_y()
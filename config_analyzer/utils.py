@@ -1,7 +1,32 @@
 import os
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Optional, List
 
 from .parser import parse_snapshot, Snapshot
+from .snapshot_cache import load_snapshot
+
+
+# Memoized find_device_history hits, LRU-bounded. Misses are not kept: the CLI
+# returns to the browser and may look again after the tree changes.
+_HISTORY_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_HISTORY_CACHE_SIZE = 256
+
+# Directory names never worth descending into when searching a repo for configs
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv", ".tox"})
+
+
+def prune_walk_dirs(dirs: List[str], history_dir: str) -> None:
+    """Prune ``os.walk`` dirnames in place before traversal.
+
+    Drops history folders (matched case-insensitively), hidden directories and
+    tool/VCS directories in ``_SKIP_DIRS`` so the walk never lists them.
+    """
+    history_dir_l = str(history_dir).lower()
+    dirs[:] = [
+        d for d in dirs
+        if d.lower() != history_dir_l and d not in _SKIP_DIRS and not d.startswith(".")
+    ]
 
 
 def safe_call(func, *args, **kwargs):
@@ -56,37 +81,62 @@ def find_device_history(repo_root: str, device: str, cfg_path: Optional[str], hi
     - Closest ancestor of the provided cfg_path
     - Repo root history folder
     - Any discovered 'history/<device>' path in the repo (shortest path)
+
+    Hits are memoized per (repo_root, device, cfg_path, history_dir): the CLI
+    loop resolves the same device repeatedly when the user moves between the
+    browser and the snapshot view. A remembered hit is re-checked with one stat.
     """
-    history_dir_l = str(history_dir).lower()
+    key = (repo_root, device, cfg_path, history_dir)
+    hit = _HISTORY_CACHE.get(key)
+    if hit is not None:
+        if os.path.isdir(hit):
+            _HISTORY_CACHE.move_to_end(key)
+            return hit
+        del _HISTORY_CACHE[key]
+    found = _find_device_history(repo_root, device, cfg_path, history_dir)
+    if found is not None:
+        _HISTORY_CACHE[key] = found
+        if len(_HISTORY_CACHE) > _HISTORY_CACHE_SIZE:
+            _HISTORY_CACHE.popitem(last=False)
+    return found
+
+
+def _find_device_history(repo_root: str, device: str, cfg_path: Optional[str], history_dir: str) -> Optional[str]:
+    root_cand = os.path.join(repo_root, history_dir, device)
+    root_checked = False
     # Prefer nearest 'history/<device>' relative to the selected cfg directory, walking up to repo root
     if cfg_path:
+        # Normalize once; dirname() keeps paths normalized so plain == works below
         repo_abs = os.path.abspath(repo_root)
         cur = os.path.dirname(os.path.abspath(cfg_path))
         while True:
             cand = os.path.join(cur, history_dir, device)
             if os.path.isdir(cand):
                 return cand
-            if os.path.abspath(cur) == repo_abs:
+            if cur == repo_abs:
+                root_checked = True
                 break
             parent = os.path.dirname(cur)
             if parent == cur:
                 break
             cur = parent
-    # Fallback 1: repo root history
-    cand = os.path.join(repo_root, history_dir, device)
-    if os.path.isdir(cand):
-        return cand
-    # Fallback 2: scan repo for any 'history/<device>' path; pick shortest path
-    hits: List[str] = []
-    for root, dirs, _files in os.walk(repo_root):
-        if any(d.lower() == history_dir_l for d in dirs):
-            path = os.path.join(root, history_dir, device)
-            if os.path.isdir(path):
-                hits.append(path)
-    if hits:
-        hits.sort(key=lambda p: len(p))
-        return hits[0]
-    return None
+    # Fallback 1: repo root history (skip the stat if the walk above already tried it)
+    if not root_checked and os.path.isdir(root_cand):
+        return root_cand
+    # Fallback 2: scan repo for any 'history/<device>' path; pick shortest path.
+    # os.walk does not follow directory symlinks, so link loops cannot trap it
+    history_dir_l = str(history_dir).lower()
+    hits: List[str] = []
+    for root, dirs, _files in os.walk(repo_root):
+        if any(d.lower() == history_dir_l for d in dirs):
+            path = os.path.join(root, history_dir, device)
+            if os.path.isdir(path):
+                hits.append(path)
+        # History folders are matched above, never descended into
+        prune_walk_dirs(dirs, history_dir)
+    if hits:
+        return min(hits, key=len)
+    return None
 
 
 def collect_snapshots(repo_root: str, device: str, selected_cfg_path: Optional[str], history_dir: str) -> List[Snapshot]:
@@ -104,27 +154,38 @@ def collect_snapshots(repo_root: str, device: str, selected_cfg_path: Optional[s
     if selected_cfg_path:
         current_config_path = selected_cfg_path
     else:
-        history_dir_l = str(history_dir).lower()
         for root, dirs, files in os.walk(repo_root):
-            # prune any history directories from traversal
-            dirs[:] = [d for d in dirs if d.lower() != history_dir_l]
+            # prune history, hidden and tool directories from traversal
+            prune_walk_dirs(dirs, history_dir)
             if f"{device}.cfg" in files:
                 current_config_path = os.path.join(root, f"{device}.cfg")
                 break
 
     if current_config_path:
-        cur = parse_snapshot(current_config_path)
+        try:
+            st = os.stat(current_config_path)
+            cur = load_snapshot(current_config_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            cur = parse_snapshot(current_config_path)
         if cur:
-            cur = cur._replace(original_filename="Current")
+            cur = replace(cur, original_filename="Current")
             snapshots.append(cur)
 
     # History snapshots
     hist_dir = find_device_history(repo_root, device, selected_cfg_path, history_dir)
     if hist_dir and os.path.isdir(hist_dir):
-        for f in sorted(os.listdir(hist_dir)):
-            full = os.path.join(hist_dir, f)
-            if os.path.isfile(full) and f.lower().endswith('.cfg'):
-                snap = parse_snapshot(full)
+        with os.scandir(hist_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith('.cfg'):
+                # DirEntry caches its stat; it keys the on-disk cache and feeds
+                # the parser's timestamp fallback without another stat
+                try:
+                    st = entry.stat()
+                except OSError:
+                    snap = parse_snapshot(entry.path)
+                else:
+                    snap = load_snapshot(entry.path, st.st_mtime_ns, st.st_size)
                 if snap:
                     snapshots.append(snap)
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import List, Optional, Any
-import os
-import inspect
 import asyncio
+import os
 
-from textual.app import ComposeResult
+from rich.console import ConsoleOptions
+from rich.measure import measure_renderables
+from rich.segment import Segment, Segments
+from textual.geometry import Size
+from textual.strip import Strip
 from textual.widgets import RichLog
-from textual.containers import Container
 from textual import events
 from .debug import get_logger
 
@@ -29,6 +32,12 @@ class SearchableTextPane(RichLog):
     }
     """
 
+    # Renderables longer than this are written in chunks so input stays live
+    STREAM_MIN_LINES = 1000
+    STREAM_CHUNK_LINES = 200
+    # Rendered lines kept per (renderable, width) so re-showing skips Rich entirely
+    RENDER_CACHE_SIZE = 4
+
     def __init__(self, *, id: Optional[str] = None, wrap: bool = False, highlight: bool = False, auto_scroll: bool = False) -> None:
         # RichLog parameters: wrap, highlight, markup, auto_scroll, max_lines
         super().__init__(id=id, wrap=wrap, highlight=highlight, markup=False, auto_scroll=auto_scroll, max_lines=None)
@@ -45,6 +54,17 @@ class SearchableTextPane(RichLog):
         self._renderable: Optional[Any] = None
         # The app will attach a SearchController instance
         self.search: Optional[SearchController] = None
+        # Chunked write state; a scroll requested meanwhile is applied at the end
+        self._streaming = False
+        self._pending_scroll_y: Optional[int] = None
+        self._pending_scroll_end = False
+        # (id(renderable), width) -> (renderable, strips, widest line width)
+        self._render_cache: "OrderedDict[tuple[int, int], tuple[Any, list, int]]" = OrderedDict()
+
+    def on_resize(self, event: events.Resize) -> None:
+        # RichLog holds writes until the first sized resize; scroll once they land
+        if event.size.width and not self._size_known:
+            self.call_later(self._apply_pending_scroll)
 
     # Mouse focus & scroll helpers
     def on_mouse_down(self, event: events.MouseDown) -> None:  # type: ignore[override]
@@ -110,6 +130,7 @@ class SearchableTextPane(RichLog):
         self.apply_search()
 
     def clear(self) -> None:
+        self._cancel_stream()
         self._lines = []
         self._base_text = None
         self._renderable = None
@@ -122,6 +143,7 @@ class SearchableTextPane(RichLog):
     # ---- Search helpers ----
     def apply_search(self) -> None:
         # Clear the RichLog before writing new content
+        self._cancel_stream()
         try:
             super().clear()
         except Exception:
@@ -182,7 +204,14 @@ class SearchableTextPane(RichLog):
 
         # No active search overlay
         if self._renderable is not None and not has_query:
-            self.write(self._renderable)
+            if self._restore_render(self._renderable):
+                return
+            if len(self._lines) > self.STREAM_MIN_LINES and self._size_known:
+                self._streaming = True
+                self.run_worker(self._stream_renderable(self._renderable), group="pane-stream", exclusive=True)
+            else:
+                self.write(self._renderable)
+                self._remember_render(self._renderable)
             return
         if self._base_text is not None:
             self.write(self._base_text)
@@ -195,6 +224,127 @@ class SearchableTextPane(RichLog):
             for line in self._lines:
                 self.write_line(line)
 
+    # ---- Chunked writes ----
+    def _cancel_stream(self) -> None:
+        if not self._streaming:
+            return
+        self._streaming = False
+        self._pending_scroll_y = None
+        self._pending_scroll_end = False
+        try:
+            self.workers.cancel_group(self, "pane-stream")
+        except Exception:
+            pass
+
+    async def _stream_renderable(self, renderable: Any) -> None:
+        """Render lazily and append a chunk of lines per event-loop turn.
+
+        Options and width are computed once, so every chunk lines up.
+        """
+        options, width = self._render_options(renderable, self.scrollable_content_region.width)
+        chunk: List[List[Segment]] = []
+        for line in Segment.split_lines(self.app.console.render(renderable, options)):
+            chunk.append(line)
+            if len(chunk) >= self.STREAM_CHUNK_LINES:
+                self._write_segment_lines(chunk, width)
+                chunk = []
+                await asyncio.sleep(0)
+        if chunk:
+            self._write_segment_lines(chunk, width)
+        self._streaming = False
+        self._remember_render(renderable)
+        self._apply_pending_scroll()
+
+    def _content_pending(self) -> bool:
+        return self._streaming or not self._size_known
+
+    def _apply_pending_scroll(self) -> None:
+        if self._pending_scroll_end:
+            # One scroll to the real end instead of chasing every chunk
+            self._pending_scroll_end = False
+            self.scroll_end(animate=False)
+        elif self._pending_scroll_y is not None:
+            target, self._pending_scroll_y = self._pending_scroll_y, None
+            self._scroll_to_y(target)
+
+    # ---- Rendered-lines cache ----
+    def _render_key(self, renderable: Any) -> Optional[tuple[int, int]]:
+        if not self._size_known:
+            return None
+        return (id(renderable), self.scrollable_content_region.width)
+
+    def _restore_render(self, renderable: Any) -> bool:
+        key = self._render_key(renderable)
+        hit = self._render_cache.get(key) if key is not None else None
+        # The renderable is held in the entry, so a matching id is the same object
+        if hit is None or hit[0] is not renderable:
+            return False
+        self._render_cache.move_to_end(key)
+        _, strips, widest = hit
+        # Strips are immutable; sharing them with the cache is safe
+        self.lines.extend(strips)
+        self._widest_line_width = widest
+        self.virtual_size = Size(widest, len(self.lines))
+        self.refresh()
+        return True
+
+    def _remember_render(self, renderable: Any) -> None:
+        key = self._render_key(renderable)
+        if key is None or renderable is not self._renderable:
+            return
+        self._store_render(key, renderable, list(self.lines), self._widest_line_width)
+
+    def _store_render(self, key: tuple[int, int], renderable: Any, strips: list, widest: int) -> None:
+        self._render_cache[key] = (renderable, strips, widest)
+        self._render_cache.move_to_end(key)
+        while len(self._render_cache) > self.RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+
+    def content_width(self) -> Optional[int]:
+        """Width write() lays renderables out against, or None before the first resize."""
+        if not self._size_known:
+            return None
+        return self.scrollable_content_region.width
+
+    def prerender(self, renderable: Any, content_width: int) -> tuple[list, int]:
+        """Render to (strips, widest line) exactly as write() would at ``content_width``.
+
+        Touches no widget state, so a worker thread can do the Rich work ahead of
+        time and hand the result to add_prerendered() on the UI thread.
+        """
+        options, width = self._render_options(renderable, content_width)
+        lines = list(Segment.split_lines(self.app.console.render(renderable, options)))
+        if not lines:
+            return [Strip.blank(width)], width
+        strips = Strip.from_lines(lines)
+        for strip in strips:
+            strip.adjust_cell_length(width)
+        return strips, max(sum(segment.cell_length for segment in line) for line in lines)
+
+    def _render_options(self, renderable: Any, content_width: int) -> tuple[ConsoleOptions, int]:
+        """Console options and width RichLog.write would use (default shrink, no expand)."""
+        from rich.text import Text
+        console = self.app.console
+        options = console.options
+        if isinstance(renderable, Text) and not self.wrap:
+            options = options.update(overflow="ignore", no_wrap=True)
+        width = measure_renderables(console, options, [renderable]).maximum
+        width = max(min(width, content_width), self.min_width)
+        return options.update_width(width), width
+
+    def add_prerendered(self, renderable: Any, content_width: int, rendered: tuple[list, int]) -> None:
+        """Seed the rendered-lines cache so showing ``renderable`` skips Rich."""
+        self._store_render((id(renderable), content_width), renderable, *rendered)
+
+    def _write_segment_lines(self, lines: List[List[Segment]], width: int) -> None:
+        newline = Segment.line()
+        segments: List[Segment] = []
+        for i, line in enumerate(lines):
+            if i:
+                segments.append(newline)
+            segments.extend(line)
+        self.write(Segments(segments), width=width)
+
     # ---- Utilities ----
     def _renderable_to_text(self, renderable: Any):
         from io import StringIO
@@ -249,7 +399,19 @@ class SearchableTextPane(RichLog):
 
     def scroll_to_y(self, target: int) -> None:
         """Public wrapper to scroll to an absolute y offset."""
-        self._scroll_to_y(max(0, int(target)))
+        target = max(0, int(target))
+        if self._content_pending():
+            # Content is still arriving; the offset may not exist yet
+            self._pending_scroll_y = target
+            self._pending_scroll_end = False
+        self._scroll_to_y(target)
+
+    def scroll_to_bottom(self) -> None:
+        """Scroll to the last line, again once any pending content is written."""
+        if self._content_pending():
+            self._pending_scroll_end = True
+            self._pending_scroll_y = None
+        self.scroll_end(animate=False)
 
     # RichLog already has these actions, no need to override
     # Just add debug logging wrappers
@@ -291,7 +453,7 @@ class SearchableTextPane(RichLog):
     def action_go_end(self) -> None:  # type: ignore[override]
         if self._debug_keys:
             self._logr.debug("pane.go_end: id=%s", getattr(self, 'id', None))
-        self.scroll_end(animate=False)
+        self.scroll_to_bottom()
         if self._debug_keys:
             self._logr.debug("pane.after_go_end: y=%s", self._get_scroll_y())
 